@@ -5,28 +5,52 @@ Main entry point for the Discord bot. Handles initialization,
 cog loading, and core event management.
 """
 
-import os
 import asyncio
+import atexit
+import contextlib
+import importlib
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 
 import discord
 from discord.ext import commands
 from dotenv import load_dotenv
 
+from src.config import Config
 from src.services.database import Database
 
+# uvloop is a faster drop-in event loop (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+# Configure logging - records go through a queue and are written to stderr
+# by a background thread, so logging never blocks the event loop
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
+))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, _log_stream, respect_handler_level=True
 )
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger("stafflens")
 
+# Extensions loaded on startup
+COGS = ["src.cogs.voice", "src.cogs.admin"]
+
 
 class StaffLens(commands.Bot):
     """
@@ -36,44 +60,80 @@ class StaffLens(commands.Bot):
     of applicant interviews in Discord voice channels.
     """
 
-    def __init__(self):
+    def __init__(self, config: Config):
         intents = discord.Intents.default()
         intents.message_content = True
         intents.voice_states = True
-        intents.members = True  # Required to check roles
+        # No members intent: voice state events carry the member (with roles),
+        # so we don't need the full member list chunked at startup
 
         super().__init__(
-            command_prefix=os.getenv("COMMAND_PREFIX", "!"),
+            command_prefix=config.command_prefix,
             intents=intents,
             description="AI-powered applicant vetting through voice analysis",
         )
 
+        # Startup configuration (immutable) + runtime overrides from admin commands
+        self.config = config
+        self._overrides: dict[str, object] = {}
+
         # Database instance
         self.db = Database()
 
         # Channel ID for posting reports
-        self.report_channel_id = int(os.getenv("REPORT_CHANNEL_ID", 0))
-
-        # Role name that triggers recording
-        self.applicant_role_name = os.getenv("APPLICANT_ROLE_NAME", "Applicant")
+        self.report_channel_id = config.report_channel_id
+        self._report_channel: discord.TextChannel | None = None
 
-        # Fit score threshold for recommendation
-        self.fit_threshold = int(os.getenv("FIT_THRESHOLD", 70))
+        # Cached VoiceCog reference (resolved on first voice event)
+        self._voice_cog_ref: commands.Cog | None = None
 
         # Active recording sessions: {voice_channel_id: session_data}
         self.active_sessions = {}
 
+        # on_ready fires again on reconnect - only load cogs once
+        self._cogs_loaded = False
+
+    @property
+    def applicant_role_name(self) -> str:
+        """Role name that triggers recording."""
+        return self._overrides.get("applicant_role_name", self.config.applicant_role_name)
+
+    @applicant_role_name.setter
+    def applicant_role_name(self, value: str):
+        self._overrides["applicant_role_name"] = value
+
+    @property
+    def fit_threshold(self) -> int:
+        """Fit score threshold for recommendation."""
+        return self._overrides.get("fit_threshold", self.config.fit_threshold)
+
+    @fit_threshold.setter
+    def fit_threshold(self, value: int):
+        self._overrides["fit_threshold"] = value
+
     async def on_ready(self):
         """Called when the bot is fully connected and ready."""
         # Load cogs here where we have an event loop
-        if not self.cogs:
+        if not self._cogs_loaded:
+            # Database setup runs alongside the gateway login - cogs need it
+            await self.db.wait_ready()
             logger.info("Loading cogs...")
-            for cog in ["src.cogs.voice", "src.cogs.admin"]:
+            # Import the heavy cog modules in parallel threads, then register
+            # them on the event loop (add_cog isn't thread-safe)
+            results = await asyncio.gather(
+                *(asyncio.to_thread(importlib.import_module, cog) for cog in COGS),
+                return_exceptions=True,
+            )
+            for cog, result in zip(COGS, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to import cog {cog}: {result}")
+                    continue
                 try:
                     self.load_extension(cog)
                     logger.info(f"Loaded cog: {cog}")
                 except Exception as e:
                     logger.error(f"Failed to load cog {cog}: {e}")
+            self._cogs_loaded = True
             logger.info(f"Loaded cogs: {list(self.cogs.keys())}")
         
         logger.info(f"Logged in as {self.user} (ID: {self.user.id})")
@@ -91,10 +151,14 @@ class StaffLens(commands.Bot):
 
     async def on_voice_state_update(self, member, before, after):
         """Handle voice state changes - delegate to voice cog."""
+        # Mute/deafen/video toggles don't move anyone - the voice cog ignores them
+        if before.channel == after.channel:
+            return
+
         logger.info(f"[BOT] Voice event: {member.display_name} | {before.channel} -> {after.channel}")
         
         # Get voice cog and call its handler
-        voice_cog = self.get_cog("VoiceCog")
+        voice_cog = self.get_voice_cog()
         if voice_cog:
             await voice_cog.handle_voice_update(member, before, after)
         else:
@@ -117,27 +181,70 @@ class StaffLens(commands.Bot):
         logger.error(f"Command error in {ctx.command}: {error}", exc_info=error)
         await ctx.send("❌ An unexpected error occurred.")
 
+    async def on_guild_channel_delete(self, channel):
+        """Drop the cached report channel if it was deleted."""
+        if channel.id == self.report_channel_id:
+            self._report_channel = None
+
+    async def on_guild_channel_update(self, before, after):
+        """Drop the cached report channel if it changed."""
+        if after.id == self.report_channel_id:
+            self._report_channel = None
+
+    async def close(self):
+        """Shut down the bot and release the database and HTTP connections."""
+        await super().close()
+        voice_cog = self.get_voice_cog()
+        if voice_cog:
+            await voice_cog.close_http()
+        await self.db.close()
+
+    def remove_cog(self, name: str):
+        """Remove a cog, dropping the cached VoiceCog reference if needed."""
+        if name == "VoiceCog":
+            self._voice_cog_ref = None
+        return super().remove_cog(name)
+
+    def get_voice_cog(self) -> commands.Cog | None:
+        """Get the voice cog, caching the lookup."""
+        if self._voice_cog_ref is None:
+            self._voice_cog_ref = self.get_cog("VoiceCog")
+        return self._voice_cog_ref
+
     def get_report_channel(self) -> discord.TextChannel | None:
         """Get the channel for posting interview reports."""
-        return self.get_channel(self.report_channel_id)
+        if self._report_channel is None:
+            self._report_channel = self.get_channel(self.report_channel_id)
+        return self._report_channel
 
 
 async def main():
     """Main entry point."""
-    token = os.getenv("DISCORD_TOKEN")
-    if not token:
+    config = Config.from_env()
+    if not config.token:
         logger.error("DISCORD_TOKEN not found in environment variables!")
         logger.error("Please create a .env file with your bot token.")
         return
 
-    bot = StaffLens()
+    bot = StaffLens(config)
     
-    # Initialize database first
-    await bot.db.initialize()
+    # Connect to Discord while the database initializes
+    gateway_task = asyncio.create_task(bot.start(config.token))
+    try:
+        await bot.db.initialize()
+    except Exception:
+        await bot.close()
+        # Reap the gateway task so it isn't left pending or unretrieved
+        gateway_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await gateway_task
+        raise
     logger.info("Database initialized")
 
-    await bot.start(token)
+    await gateway_task
 
 
 if __name__ == "__main__":
+    if uvloop:
+        uvloop.install()
     asyncio.run(main())
@@ -5,22 +5,104 @@ Provides commands for viewing past interviews, managing settings,
 and other administrative functions.
 """
 
+import asyncio
 import logging
-from datetime import datetime
+import os
+import tempfile
+from dataclasses import dataclass
+from itertools import islice
 
 import discord
 from discord.ext import commands
 
 from src.utils.embeds import create_report_embed
+from src.utils.send_pool import get_send_pool
 
 logger = logging.getLogger("stafflens.admin")
 
+# Characters encoded per write when spooling long transcripts to disk
+TRANSCRIPT_CHUNK_CHARS = 64 * 1024
+
+
+@dataclass(slots=True)
+class MockApplicant:
+    """Stand-in for a Discord member when rebuilding reports from the database."""
+
+    display_name: str
+    id: int
+    avatar: object = None
+
+
+def _transcript_preview(transcript: str) -> str:
+    """First 500 chars of a transcript."""
+    return (transcript[:500] + "...") if len(transcript) > 500 else transcript
+
+
+def _write_transcript_file(transcript: str) -> str:
+    """Write a transcript to a temp file in chunks and return its path."""
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".txt", delete=False
+    ) as f:
+        for start in range(0, len(transcript), TRANSCRIPT_CHUNK_CHARS):
+            f.write(transcript[start:start + TRANSCRIPT_CHUNK_CHARS])
+        return f.name
+
 
 class AdminCog(commands.Cog):
     """Administrative commands for StaffLens."""
 
+    # !status embed fields: (name, value(cog, stats), inline)
+    _STATUS_FIELDS = [
+        ("Applicant Role", lambda s, stats: s.bot.applicant_role_name, True),
+        ("Fit Threshold", lambda s, stats: f"{s.bot.fit_threshold}/100", True),
+        ("Active Sessions", lambda s, stats: len(s.bot.active_sessions), True),
+        (
+            "Report Channel",
+            lambda s, stats: (
+                f"#{channel.name}" if (channel := s.bot.get_report_channel()) else "Not configured"
+            ),
+            True,
+        ),
+        ("Total Interviews", lambda s, stats: stats.get("total_interviews", 0), True),
+        ("Avg Fit Score", lambda s, stats: f"{stats.get('avg_fit_score', 0):.1f}", True),
+    ]
+
     def __init__(self, bot):
         self.bot = bot
+        self.send_pool = get_send_pool()
+
+        # Per-guild role lookup: {guild_id: {role_name.casefold(): role}}
+        self._role_index: dict[int, dict[str, discord.Role]] = {}
+
+    def _get_role_index(self, guild: discord.Guild) -> dict[str, discord.Role]:
+        """Get (building on first use) the name -> role index for a guild."""
+        index = self._role_index.get(guild.id)
+        if index is None:
+            index = {role.name.casefold(): role for role in guild.roles}
+            self._role_index[guild.id] = index
+        return index
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        """Keep the role index in sync."""
+        index = self._role_index.get(role.guild.id)
+        if index is not None:
+            index[role.name.casefold()] = role
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Keep the role index in sync."""
+        index = self._role_index.get(after.guild.id)
+        if index is not None:
+            index.pop(before.name.casefold(), None)
+            index[after.name.casefold()] = after
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Keep the role index in sync."""
+        index = self._role_index.get(role.guild.id)
+        if index is not None:
+            index.pop(role.name.casefold(), None)
 
     @commands.command(name="history")
     @commands.has_permissions(manage_guild=True)
@@ -32,22 +114,25 @@ class AdminCog(commands.Cog):
         Default: Shows last 10 interviews
         Requires: Manage Server permission
         """
+        # Embeds hold at most 25 fields
+        limit = max(1, min(limit, 25))
+
         interviews = await self.bot.db.get_recent_interviews(
             guild_id=ctx.guild.id,
             limit=limit,
         )
 
         if not interviews:
-            await ctx.send("📋 No interview history found.")
+            await self.send_pool.submit(ctx.channel, content="📋 No interview history found.")
             return
 
         embed = discord.Embed(
             title="📋 Recent Interviews",
             color=discord.Color.blue(),
-            timestamp=datetime.utcnow(),
+            timestamp=discord.utils.utcnow(),
         )
 
-        for interview in interviews:
+        for interview in islice(interviews, 25):
             score = interview.get("fit_score", "N/A")
             recommended = "✅" if interview.get("recommended") else "❌"
             date = interview.get("created_at", "Unknown")
@@ -62,7 +147,7 @@ class AdminCog(commands.Cog):
                 inline=True,
             )
 
-        await ctx.send(embed=embed)
+        await self.send_pool.submit(ctx.channel, embed=embed)
 
     @commands.command(name="interview")
     @commands.has_permissions(manage_guild=True)
@@ -73,17 +158,17 @@ class AdminCog(commands.Cog):
         Usage: !interview <id>
         Requires: Manage Server permission
         """
-        interview = await self.bot.db.get_interview(interview_id)
+        interview = await self.bot.db.loader.load(interview_id)
 
         if not interview:
-            await ctx.send(f"❌ Interview #{interview_id} not found.")
+            await self.send_pool.submit(ctx.channel, content=f"❌ Interview #{interview_id} not found.")
             return
 
         # Create a detailed embed
         embed = discord.Embed(
             title=f"Interview #{interview_id}",
             color=discord.Color.blue(),
-            timestamp=datetime.utcnow(),
+            timestamp=discord.utils.utcnow(),
         )
 
         embed.add_field(
@@ -122,16 +207,14 @@ class AdminCog(commands.Cog):
 
         # Add transcript preview
         if interview.get("transcript"):
-            preview = interview["transcript"][:500]
-            if len(interview["transcript"]) > 500:
-                preview += "..."
+            preview = _transcript_preview(interview["transcript"])
             embed.add_field(
                 name="Transcript Preview",
                 value=f"```{preview}```",
                 inline=False,
             )
 
-        await ctx.send(embed=embed)
+        await self.send_pool.submit(ctx.channel, embed=embed)
 
     @commands.command(name="transcript")
     @commands.has_permissions(manage_guild=True)
@@ -147,30 +230,35 @@ class AdminCog(commands.Cog):
         try:
             interview_id_int = int(interview_id_clean)
         except ValueError:
-            await ctx.send(f"❌ Invalid interview ID: {interview_id}. Please use a number like `!transcript 11`")
+            await self.send_pool.submit(ctx.channel, content=f"❌ Invalid interview ID: {interview_id}. Please use a number like `!transcript 11`")
             return
         
-        interview = await self.bot.db.get_interview(interview_id_int)
+        interview = await self.bot.db.loader.load(interview_id_int)
 
         if not interview:
-            await ctx.send(f"❌ Interview #{interview_id_int} not found.")
+            await self.send_pool.submit(ctx.channel, content=f"❌ Interview #{interview_id_int} not found.")
             return
 
         transcript = interview.get("transcript", "No transcript available.")
 
         # If transcript is too long, send as file
         if len(transcript) > 1900:
-            # Use BytesIO to create a file-like object
-            import io
-            file_buffer = io.BytesIO(transcript.encode('utf-8'))
-            file = discord.File(
-                fp=file_buffer,
-                filename=f"transcript_{interview_id_int}.txt",
-            )
-            await ctx.send(f"📄 Transcript for Interview #{interview_id_int}:", file=file)
+            # Spool to a temp file off the event loop - long transcripts can be
+            # several MB and shouldn't be held in memory twice
+            path = await asyncio.to_thread(_write_transcript_file, transcript)
+            file = discord.File(path, filename=f"transcript_{interview_id_int}.txt")
+            try:
+                await self.send_pool.submit(ctx.channel, content=f"📄 Transcript for Interview #{interview_id_int}:", file=file)
+            finally:
+                file.close()
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
         else:
-            await ctx.send(
-                f"📄 **Transcript for Interview #{interview_id_int}:**\n```{transcript}```"
+            await self.send_pool.submit(
+                ctx.channel,
+                content=f"📄 **Transcript for Interview #{interview_id_int}:**\n```{transcript}```"
             )
 
     @commands.command(name="reanalyze")
@@ -187,44 +275,40 @@ class AdminCog(commands.Cog):
         try:
             interview_id_int = int(interview_id_clean)
         except ValueError:
-            await ctx.send(f"❌ Invalid interview ID: {interview_id}. Please use a number like `!reanalyze 11`")
+            await self.send_pool.submit(ctx.channel, content=f"❌ Invalid interview ID: {interview_id}. Please use a number like `!reanalyze 11`")
             return
         
-        interview = await self.bot.db.get_interview(interview_id_int)
+        interview = await self.bot.db.loader.load(interview_id_int)
 
         if not interview:
-            await ctx.send(f"❌ Interview #{interview_id_int} not found.")
+            await self.send_pool.submit(ctx.channel, content=f"❌ Interview #{interview_id_int} not found.")
             return
 
         transcript = interview.get("transcript")
         if not transcript:
-            await ctx.send("❌ No transcript available for this interview.")
+            await self.send_pool.submit(ctx.channel, content="❌ No transcript available for this interview.")
             return
 
-        await ctx.send("🔄 Re-analyzing interview...")
+        await self.send_pool.submit(ctx.channel, content="🔄 Re-analyzing interview...")
 
         # Get the analysis service from voice cog
-        voice_cog = self.bot.get_cog("VoiceCog")
+        voice_cog = self.bot.get_voice_cog()
         if not voice_cog:
-            await ctx.send("❌ Voice cog not loaded.")
+            await self.send_pool.submit(ctx.channel, content="❌ Voice cog not loaded.")
             return
 
-        analysis = await voice_cog.analysis.analyze_transcript(transcript)
+        # A re-analysis has to reach the model - a cached result would only
+        # be saved again as a duplicate row
+        analysis = await voice_cog.analysis.analyze_transcript(transcript, use_cache=False)
 
         if not analysis:
-            await ctx.send("❌ Analysis failed.")
+            await self.send_pool.submit(ctx.channel, content="❌ Analysis failed.")
             return
 
         # Update database
         await self.bot.db.save_analysis(interview_id_int, analysis)
 
         # Create a mock applicant object for the embed
-        class MockApplicant:
-            def __init__(self, name, id):
-                self.display_name = name
-                self.id = id
-                self.avatar = None
-
         applicant = MockApplicant(
             interview["applicant_name"],
             interview["applicant_id"],
@@ -233,11 +317,11 @@ class AdminCog(commands.Cog):
         embed = create_report_embed(
             applicant=applicant,
             analysis=analysis,
-            transcript_preview=transcript[:500],
+            transcript_preview=_transcript_preview(transcript),
             fit_threshold=self.bot.fit_threshold,
         )
 
-        await ctx.send("✅ Analysis complete!", embed=embed)
+        await self.send_pool.submit(ctx.channel, content="✅ Analysis complete!", embed=embed)
 
     @commands.command(name="setrole")
     @commands.has_permissions(administrator=True)
@@ -252,12 +336,14 @@ class AdminCog(commands.Cog):
         Update APPLICANT_ROLE_NAME in .env for persistence.
         """
         # Verify role exists
-        role = discord.utils.get(ctx.guild.roles, name=role_name)
+        role = self._get_role_index(ctx.guild).get(role_name.casefold())
         if not role:
-            await ctx.send(f"⚠️ Role '{role_name}' not found, but setting anyway.")
+            await self.send_pool.submit(ctx.channel, content=f"⚠️ Role '{role_name}' not found, but setting anyway.")
+        else:
+            role_name = role.name  # Use the exact name the voice cog matches on
 
         self.bot.applicant_role_name = role_name
-        await ctx.send(f"✅ Applicant role set to: **{role_name}**")
+        await self.send_pool.submit(ctx.channel, content=f"✅ Applicant role set to: **{role_name}**")
 
     @commands.command(name="setthreshold")
     @commands.has_permissions(administrator=True)
@@ -269,11 +355,11 @@ class AdminCog(commands.Cog):
         Requires: Administrator permission
         """
         if not 1 <= threshold <= 100:
-            await ctx.send("❌ Threshold must be between 1 and 100.")
+            await self.send_pool.submit(ctx.channel, content="❌ Threshold must be between 1 and 100.")
             return
 
         self.bot.fit_threshold = threshold
-        await ctx.send(f"✅ Fit threshold set to: **{threshold}**")
+        await self.send_pool.submit(ctx.channel, content=f"✅ Fit threshold set to: **{threshold}**")
 
     @commands.command(name="status")
     async def show_status(self, ctx: commands.Context):
@@ -285,46 +371,16 @@ class AdminCog(commands.Cog):
         embed = discord.Embed(
             title="🤖 StaffLens Status",
             color=discord.Color.green(),
-            timestamp=datetime.utcnow(),
-        )
-
-        embed.add_field(
-            name="Applicant Role",
-            value=self.bot.applicant_role_name,
-            inline=True,
-        )
-        embed.add_field(
-            name="Fit Threshold",
-            value=f"{self.bot.fit_threshold}/100",
-            inline=True,
-        )
-        embed.add_field(
-            name="Active Sessions",
-            value=str(len(self.bot.active_sessions)),
-            inline=True,
-        )
-
-        report_channel = self.bot.get_report_channel()
-        embed.add_field(
-            name="Report Channel",
-            value=f"#{report_channel.name}" if report_channel else "Not configured",
-            inline=True,
+            timestamp=discord.utils.utcnow(),
         )
 
         # Database stats
         stats = await self.bot.db.get_stats(ctx.guild.id)
-        embed.add_field(
-            name="Total Interviews",
-            value=str(stats.get("total_interviews", 0)),
-            inline=True,
-        )
-        embed.add_field(
-            name="Avg Fit Score",
-            value=f"{stats.get('avg_fit_score', 0):.1f}",
-            inline=True,
-        )
 
-        await ctx.send(embed=embed)
+        for name, value_fn, inline in self._STATUS_FIELDS:
+            embed.add_field(name=name, value=str(value_fn(self, stats)), inline=inline)
+
+        await self.send_pool.submit(ctx.channel, embed=embed)
 
 
 def setup(bot):
@@ -10,15 +10,18 @@ This cog handles:
 """
 
 import asyncio
+import hashlib
 import logging
 import io
-import tempfile
 import os
 import json
+import re
 import time
-from datetime import datetime
+from collections import deque
+from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import discord
 from discord.ext import commands
@@ -26,11 +29,100 @@ import aiohttp
 
 from src.services.transcription import TranscriptionService
 from src.services.analysis import AnalysisService
-from src.services.tts import get_tts_service
+from src.services.tts import TTSService, get_tts_service
+from src.utils import fastjson
+from src.utils.retry import backoff_delay
 from src.utils.embeds import create_report_embed
 
 logger = logging.getLogger("stafflens.voice")
 
+# Try to import tiktoken - without it token counts are estimated from length
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Try to import watchdog - without it the config mtime is checked per session
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# Community-specific interview focus
+INTERVIEW_CONFIG_PATH = Path("interview-config.md")
+
+# Opening questions generated for each system prompt, reused across restarts
+# and applicants. Entries come only from OPENING_PROMPT, which names nobody.
+OPENING_QUESTION_CACHE_PATH = Path(".cache/opening_questions.json")
+
+# OpenRouter request limits - a short connect bound fails fast on an
+# unreachable provider so the retry can go elsewhere
+OPENROUTER_TIMEOUT = aiohttp.ClientTimeout(total=15, connect=3, sock_read=12)
+
+# Asks for the first question. Carries no applicant details - the spoken intro
+# already greets them by name - so the answer is safe to cache and replay
+OPENING_PROMPT = "[SYSTEM: A new applicant has just joined the voice channel and has already been greeted by name. Begin the interview with your first question. Remember to keep it short since this will be spoken aloud.]"
+
+# Fixed lines spoken in every interview - synthesized once and replayed
+INTRO_BODY = (
+    "This is the first stage of your application interview. "
+    "I'll be asking you a few questions to get to know you better. "
+    "Take as long as you need with your answers! "
+    "If you have any questions after we're done, please direct them to the person who set up this interview."
+)
+FIRST_QUESTION_LEAD_IN = "Alright, let's begin. First question:"
+SILENCE_REMINDER = "Take your time! I'm here whenever you're ready."
+CLOSING_BODY = (
+    "Thank you so much for taking the time to speak with me today. "
+    "I'll put together a summary for the team to review. "
+    "If you have any questions, please reach out to the person who set up this interview. "
+    "Take care!"
+)
+STATIC_PHRASES = (INTRO_BODY, FIRST_QUESTION_LEAD_IN, SILENCE_REMINDER, CLOSING_BODY)
+
+# Discord voice receive format: 48kHz 16-bit stereo PCM
+PCM_SAMPLE_RATE = 48000
+PCM_CHANNELS = 2
+PCM_BYTES_PER_SECOND = PCM_SAMPLE_RATE * PCM_CHANNELS * 2
+
+# Longest answer recorded - the answer is cut off and transcribed once it's reached
+MAX_UTTERANCE_SECONDS = 120
+
+# User/assistant exchanges sent verbatim to the LLM (the system prompt is kept
+# separately); older turns are folded into a running summary
+MAX_HISTORY_TURNS = 6
+
+# Upper bound on prompt tokens per LLM request - oldest turns are dropped past it
+PROMPT_TOKEN_BUDGET = 4000
+
+# Evicted messages that trigger a summary update
+SUMMARY_BATCH_MESSAGES = 4
+
+SUMMARY_PROMPT = """You keep running notes on a voice interview for the interviewer.
+Merge the earlier notes with the new exchanges into one concise summary (under 100 words).
+Keep concrete facts the applicant shared and the topics already covered. Output only the summary."""
+
+# Used when interview-config.md is missing or unreadable
+DEFAULT_COMMUNITY_CONTEXT = """CONTEXT:
+- This is a general Discord community
+- You're having a voice conversation (keep responses concise and natural for speech)
+- The applicant can hear you speak, so be warm and conversational"""
+
+# **Section:** headers in interview-config.md and their body (up to the next
+# bold header, horizontal rule, or markdown heading)
+_SECTION_RE = re.compile(
+    r"\*\*(Server Name|Community Type|What We Value|Primary Topics to Explore|"
+    r"Personality Traits We Care About|Red Flags to Watch For|Tone|Special Instructions):\*\*"
+    r"[ \t]*(.*?)(?=\n\*\*|\n---|\n## |\Z)",
+    re.DOTALL,
+)
+
+# "- item" bullet lines within a section body
+_BULLET_RE = re.compile(r"^[ \t]*- (.{2,}?)[ \t]*$", re.MULTILINE)
+
 # Base system prompt template - community config gets inserted
 INTERVIEWER_SYSTEM_PROMPT_TEMPLATE = """CRITICAL RULES - READ FIRST:
 1. **KEEP IT SHORT** - Maximum 2 sentences per response. One brief reaction + one question. That's it.
@@ -74,134 +166,265 @@ When ready to end (ONLY after 6+ questions), include "[INTERVIEW_COMPLETE]" at t
 
 Remember: This is VOICE. Keep it conversational and SHORT. NO GREETINGS. DO NOT END EARLY."""
 
+# The template split once around its only placeholder - the prefix is
+# byte-identical across communities so providers can cache it
+_PROMPT_PREFIX, _PROMPT_SUFFIX = INTERVIEWER_SYSTEM_PROMPT_TEMPLATE.split("{community_context}")
+
+
+# Sentence terminators for streamed speech - must be followed by whitespace
+# (so decimals like "3.5" don't split) and not end a common title
+_SENTENCE_END_RE = re.compile(r"(?<!\bMr)(?<!\bMrs)(?<!\bMs)(?<!\bDr)(?<!\bSt)[.!?]+[\"')\]]*(?=\s)")
+
+# Shorter fragments are merged into the next sentence before speaking
+MIN_SENTENCE_CHARS = 10
+
+# Links - replaced for display, dropped for speech
+_LINK_RE = re.compile(r"https?://\S+|www\.\S+|\S+\.(?:com|org|net|io|gg|co|dev|ai)\S*")
+
+# Everything stripped before speaking, as one alternation so it's a single
+# scan: links, "check out"/"visit" references, *actions*/_actions_,
+# control markers, and bracketed [NOTE: ...] style commentary
+_SPEECH_STRIP_RE = re.compile(
+    _LINK_RE.pattern +
+    r"|(?i:check out|visit) \S+"
+    r"|\*[^*]+\*|_[^_]+_"
+    r"|\[(?:INTERVIEW_COMPLETE|(?i:pause))\]"
+    r"|\[(?i:SYSTEM|NOTE|INTERNAL|THINKING):[^\]]*\]"
+    r"|\[[A-Z][A-Z\s]*:[^\]]*\]"
+)
+
+
+@lru_cache(maxsize=256)
+def clean_output(text: str) -> tuple[str, str]:
+    """
+    Clean LLM text for the text channel and for TTS.
+    
+    Memoized - every reply is cleaned for both display and speech, and
+    cached replies and fixed phrases come back around.
+    
+    Returns:
+        (display_text, speech_text)
+    """
+    display_text = _LINK_RE.sub("[link removed]", text).replace("[INTERVIEW_COMPLETE]", "")
+    speech_text = " ".join(_SPEECH_STRIP_RE.sub("", text).split())
+    return display_text.strip(), speech_text
+
+
+def split_sentences(buffer: str) -> tuple[list[str], str]:
+    """
+    Split complete sentences off the front of a streaming text buffer.
+    
+    Returns:
+        (complete sentences, remaining partial text)
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END_RE.finditer(buffer):
+        candidate = buffer[start:match.end()].strip()
+        if len(candidate) >= MIN_SENTENCE_CHARS:
+            sentences.append(candidate)
+            start = match.end()
+    return sentences, buffer[start:]
+
+
+@lru_cache(maxsize=1)
+def _token_encoding():
+    """Load the tokenizer once (it reads its BPE tables on first use)."""
+    return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=512)
+def count_tokens(text: str) -> int:
+    """Count (or, without tiktoken, estimate) the tokens in a message."""
+    if tiktoken is None:
+        return len(text) // 4 + 1
+    return len(_token_encoding().encode(text))
+
+
+def fit_to_budget(messages: list[dict], budget: int = PROMPT_TOKEN_BUDGET) -> list[dict]:
+    """
+    Drop the oldest conversation turns until the prompt fits the token budget.
+    
+    Leading system messages and the latest turn are always kept.
+    """
+    start = 0
+    while start < len(messages) and messages[start]["role"] == "system":
+        start += 1
+    
+    total = sum(count_tokens(m["content"]) for m in messages)
+    drop = start
+    while total > budget and drop < len(messages) - 1:
+        total -= count_tokens(messages[drop]["content"])
+        drop += 1
+    
+    if drop == start:
+        return messages
+    logger.debug(f"Dropped {drop - start} messages to fit the {budget} token budget")
+    return messages[:start] + messages[drop:]
+
+
+def with_prompt_caching(history: list[dict]) -> list[dict]:
+    """
+    Copy the conversation for sending, marking the leading system messages cacheable.
+    
+    The prompt prefix is byte-identical across sessions and the rest of the
+    system prompt (and the running summary) across turns, so providers that
+    support prompt caching (e.g. Anthropic via OpenRouter) can reuse them.
+    """
+    messages = list(history)
+    if messages and messages[0]["role"] == "system" and isinstance(messages[0]["content"], str):
+        system_prompt = messages[0]["content"]
+        if system_prompt.startswith(_PROMPT_PREFIX):
+            # Cache breakpoints after the shared prefix and after the community context
+            parts = [
+                {"type": "text", "text": _PROMPT_PREFIX, "cache_control": {"type": "ephemeral"}},
+                {"type": "text", "text": system_prompt[len(_PROMPT_PREFIX):], "cache_control": {"type": "ephemeral"}},
+            ]
+        else:
+            parts = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+        messages[0] = {"role": "system", "content": parts}
+    
+    # Running summary block, if any, directly follows the system prompt
+    if len(messages) > 1 and messages[1]["role"] == "system" and isinstance(messages[1]["content"], str):
+        messages[1] = {
+            "role": "system",
+            "content": [{"type": "text", "text": messages[1]["content"], "cache_control": {"type": "ephemeral"}}],
+        }
+    return messages
+
+
+def _config_mtime() -> Optional[float]:
+    """Modification time of interview-config.md, or None if missing."""
+    try:
+        return INTERVIEW_CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return None
+
+
+class _ConfigChangeHandler(FileSystemEventHandler):
+    """Marks the interview config dirty when watchdog sees it change."""
+
+    def on_any_event(self, event):
+        global _config_dirty
+        paths = (event.src_path, getattr(event, "dest_path", ""))
+        if any(path and Path(path).name == INTERVIEW_CONFIG_PATH.name for path in paths):
+            _config_dirty = True
+
+
+# Filesystem watcher state - while the observer runs, the config is only
+# re-checked after it reports a change
+_config_observer = None
+_config_dirty = True
+_config_version: Optional[float] = None
+
+
+def watch_interview_config():
+    """Start watching interview-config.md for changes (no-op without watchdog)."""
+    global _config_observer, _config_dirty
+    if not WATCHDOG_AVAILABLE or _config_observer is not None:
+        return
+    
+    try:
+        observer = Observer()
+        observer.schedule(_ConfigChangeHandler(), str(INTERVIEW_CONFIG_PATH.resolve().parent))
+        observer.daemon = True
+        observer.start()
+    except Exception as e:
+        logger.warning(f"Could not watch interview-config.md, checking mtime instead: {e}")
+        return
+    
+    _config_dirty = True
+    _config_observer = observer
+
+
+def stop_watching_interview_config():
+    """Stop the interview-config.md watcher."""
+    global _config_observer
+    if _config_observer is not None:
+        _config_observer.stop()
+        _config_observer = None
+
+
+def _current_config_version() -> Optional[float]:
+    """Config mtime, only stat'ed when the watcher reported a change (or isn't running)."""
+    global _config_dirty, _config_version
+    if _config_observer is None:
+        return _config_mtime()
+    if _config_dirty:
+        # Clear first so a write landing during the stat marks it dirty again
+        _config_dirty = False
+        _config_version = _config_mtime()
+    return _config_version
+
 
 def load_interview_config() -> str:
     """
     Load custom interview configuration from interview-config.md.
     
+    The parsed result is cached until the file's mtime changes.
+    
     Returns community context string to inject into system prompt.
     """
-    config_path = Path("interview-config.md")
+    return _load_interview_config(_current_config_version())
+
+
+@lru_cache(maxsize=1)
+def _load_interview_config(mtime: Optional[float]) -> str:
+    """Parse interview-config.md (cached per mtime)."""
+    config_path = INTERVIEW_CONFIG_PATH
     
     if not config_path.exists():
         logger.warning("interview-config.md not found, using default config")
-        return """CONTEXT:
-- This is a general Discord community
-- You're having a voice conversation (keep responses concise and natural for speech)
-- The applicant can hear you speak, so be warm and conversational"""
+        return DEFAULT_COMMUNITY_CONTEXT
     
     try:
         content = config_path.read_text(encoding="utf-8")
         
-        # Parse the markdown to extract key sections
+        # Single pass over the markdown: collect each known section's body
+        sections: dict[str, str] = {}
+        for match in _SECTION_RE.finditer(content):
+            sections.setdefault(match.group(1), match.group(2))
+        
+        def line_value(name: str) -> str:
+            return sections.get(name, "").split("\n", 1)[0].strip()
+        
+        def bullets(name: str) -> list[str]:
+            return _BULLET_RE.findall(sections.get(name, ""))
+        
+        # Emit context in a fixed order regardless of section order in the file
         context_parts = []
         
-        # Extract server name
-        if "**Server Name:**" in content:
-            for line in content.split("\n"):
-                if "**Server Name:**" in line:
-                    server_name = line.replace("**Server Name:**", "").strip()
-                    if server_name:
-                        context_parts.append(f"- This is the {server_name} Discord server")
-                    break
+        server_name = line_value("Server Name")
+        if server_name:
+            context_parts.append(f"- This is the {server_name} Discord server")
         
-        # Extract community type
-        if "**Community Type:**" in content:
-            for line in content.split("\n"):
-                if "**Community Type:**" in line:
-                    comm_type = line.replace("**Community Type:**", "").strip()
-                    if comm_type:
-                        context_parts.append(f"- Community focus: {comm_type}")
-                    break
+        comm_type = line_value("Community Type")
+        if comm_type:
+            context_parts.append(f"- Community focus: {comm_type}")
         
-        # Extract what we value
-        if "**What We Value:**" in content:
-            start = content.find("**What We Value:**")
-            end = content.find("---", start + 1)
-            if end == -1:
-                end = content.find("## Interview Focus", start)
-            if start != -1:
-                values_section = content[start:end] if end != -1 else content[start:start+500]
-                values = []
-                for line in values_section.split("\n"):
-                    line = line.strip()
-                    if line.startswith("- ") and len(line) > 3:
-                        values.append(line[2:])
-                if values:
-                    context_parts.append(f"- Community values: {', '.join(values[:5])}")
-        
-        # Extract primary topics
-        if "**Primary Topics to Explore:**" in content:
-            start = content.find("**Primary Topics to Explore:**")
-            end = content.find("**Personality Traits", start)
-            if end == -1:
-                end = start + 600
-            topics_section = content[start:end]
-            topics = []
-            for line in topics_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- ") and len(line) > 3:
-                    topics.append(line[2:])
-            if topics:
-                context_parts.append(f"\nTOPICS TO EXPLORE:\n" + "\n".join(f"- {t}" for t in topics[:6]))
-        
-        # Extract personality traits
-        if "**Personality Traits We Care About:**" in content:
-            start = content.find("**Personality Traits We Care About:**")
-            end = content.find("**Red Flags", start)
-            if end == -1:
-                end = start + 500
-            traits_section = content[start:end]
-            traits = []
-            for line in traits_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- ") and len(line) > 3:
-                    traits.append(line[2:])
-            if traits:
-                context_parts.append(f"\nTRAITS WE'RE LOOKING FOR:\n" + "\n".join(f"- {t}" for t in traits[:5]))
-        
-        # Extract red flags
-        if "**Red Flags to Watch For:**" in content:
-            start = content.find("**Red Flags to Watch For:**")
-            end = content.find("---", start + 1)
-            if end == -1:
-                end = content.find("## Interview Style", start)
-            if end == -1:
-                end = start + 500
-            flags_section = content[start:end]
-            flags = []
-            for line in flags_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- ") and len(line) > 3:
-                    flags.append(line[2:])
-            if flags:
-                context_parts.append(f"\nRED FLAGS TO WATCH FOR:\n" + "\n".join(f"- {t}" for t in flags[:5]))
-        
-        # Extract tone/style
-        if "**Tone:**" in content:
-            for line in content.split("\n"):
-                if "**Tone:**" in line:
-                    tone = line.replace("**Tone:**", "").strip()
-                    if tone:
-                        context_parts.append(f"\nINTERVIEW TONE: {tone}")
-                    break
+        values = bullets("What We Value")
+        if values:
+            context_parts.append(f"- Community values: {', '.join(values[:5])}")
+        
+        topics = bullets("Primary Topics to Explore")
+        if topics:
+            context_parts.append(f"\nTOPICS TO EXPLORE:\n" + "\n".join(f"- {t}" for t in topics[:6]))
+        
+        traits = bullets("Personality Traits We Care About")
+        if traits:
+            context_parts.append(f"\nTRAITS WE'RE LOOKING FOR:\n" + "\n".join(f"- {t}" for t in traits[:5]))
         
-        # Extract special instructions
-        if "**Special Instructions:**" in content:
-            start = content.find("**Special Instructions:**")
-            end = content.find("---", start + 1)
-            if end == -1:
-                end = content.find("## About", start)
-            if end == -1:
-                end = start + 400
-            instr_section = content[start:end]
-            instructions = []
-            for line in instr_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- ") and len(line) > 3:
-                    instructions.append(line[2:])
-            if instructions:
-                context_parts.append(f"\nSPECIAL INSTRUCTIONS:\n" + "\n".join(f"- {i}" for i in instructions[:4]))
+        flags = bullets("Red Flags to Watch For")
+        if flags:
+            context_parts.append(f"\nRED FLAGS TO WATCH FOR:\n" + "\n".join(f"- {t}" for t in flags[:5]))
+        
+        tone = line_value("Tone")
+        if tone:
+            context_parts.append(f"\nINTERVIEW TONE: {tone}")
+        
+        instructions = bullets("Special Instructions")
+        if instructions:
+            context_parts.append(f"\nSPECIAL INSTRUCTIONS:\n" + "\n".join(f"- {i}" for i in instructions[:4]))
         
         if context_parts:
             result = "CONTEXT:\n" + "\n".join(context_parts)
@@ -211,23 +434,83 @@ def load_interview_config() -> str:
             return result
         else:
             logger.warning("Could not parse interview-config.md, using defaults")
-            return """CONTEXT:
-- This is a general Discord community
-- You're having a voice conversation (keep responses concise and natural for speech)
-- The applicant can hear you speak, so be warm and conversational"""
+            return DEFAULT_COMMUNITY_CONTEXT
             
     except Exception as e:
         logger.error(f"Error loading interview-config.md: {e}")
-        return """CONTEXT:
-- This is a general Discord community  
-- You're having a voice conversation (keep responses concise and natural for speech)
-- The applicant can hear you speak, so be warm and conversational"""
+        return DEFAULT_COMMUNITY_CONTEXT
 
 
 def get_system_prompt() -> str:
     """Build the full system prompt with custom community config."""
-    community_context = load_interview_config()
-    return INTERVIEWER_SYSTEM_PROMPT_TEMPLATE.format(community_context=community_context)
+    return _build_prompt(_current_config_version())
+
+
+@lru_cache(maxsize=1)
+def _build_prompt(mtime: Optional[float]) -> str:
+    """Assemble the system prompt (cached per config mtime)."""
+    return _PROMPT_PREFIX + _load_interview_config(mtime) + _PROMPT_SUFFIX
+
+
+class ActivitySink(discord.sinks.Sink):
+    """
+    Sink that records applicant PCM into a fixed buffer and signals the
+    event loop whenever audio arrives.
+    
+    py-cord calls write() from its receive thread for every voice packet.
+    Only the applicant's packets are kept - anyone else in the channel would
+    interleave their PCM with the answer. Those are copied straight into a
+    preallocated buffer (no BytesIO or WAV framing), then we hop to the loop
+    thread to timestamp the packet and wake any waiter, so silence detection
+    doesn't poll.
+    """
+
+    def __init__(self, applicant_id: int, loop: asyncio.AbstractEventLoop, buffer: bytearray):
+        super().__init__()
+        self.applicant_id = applicant_id
+        self.loop = loop
+        self.audio_event = asyncio.Event()
+        self.last_audio_at: Optional[float] = None  # loop.time() of last packet
+        
+        # Filled from the start; once full, later packets are dropped (never
+        # overwriting the answer) and full_event tells the recorder to stop
+        self.buffer = buffer
+        self.bytes_written = 0
+        self.full_event = asyncio.Event()
+
+    def write(self, data, user):
+        if user != self.applicant_id:
+            return
+        
+        space = len(self.buffer) - self.bytes_written
+        if space <= 0:
+            return
+        
+        data = memoryview(data)[:space]
+        end = self.bytes_written + len(data)
+        memoryview(self.buffer)[self.bytes_written:end] = data
+        self.bytes_written = end
+        
+        self.loop.call_soon_threadsafe(self._on_audio, end == len(self.buffer))
+
+    def _on_audio(self, full: bool):
+        """Record packet arrival (runs on the event loop)."""
+        self.last_audio_at = self.loop.time()
+        self.audio_event.set()
+        if full:
+            self.full_event.set()
+
+    def read_pcm(self) -> Optional[memoryview]:
+        """
+        Get the recorded PCM in order.
+        
+        Returns:
+            48kHz 16-bit stereo PCM (a view into the buffer), or None if
+            nothing was recorded
+        """
+        if not self.bytes_written:
+            return None
+        return memoryview(self.buffer)[:self.bytes_written]
 
 
 class InterviewSession:
@@ -238,28 +521,60 @@ class InterviewSession:
         self.applicant = applicant
         self.guild = channel.guild
         self.text_channel = text_channel  # For accessibility text display
-        self.started_at = datetime.utcnow()
+        # Wall-clock start for the report; monotonic start for durations
+        self.started_at = datetime.now(timezone.utc)
+        self.started_monotonic = time.monotonic()
         
         # Voice connection
         self.connection: Optional[discord.VoiceClient] = None
         
         # Recording state
-        self.sink: Optional[discord.sinks.WaveSink] = None
+        self.sink: Optional[ActivitySink] = None
+        self.pcm_buffer = bytearray(PCM_BYTES_PER_SECOND * MAX_UTTERANCE_SECONDS)
         self.is_recording = False
-        self.last_audio_size = 0
-        self.silence_start: Optional[float] = None
         
         # Conversation state
-        self.conversation_history: list[dict] = []
+        # System prompt kept apart so the bounded history never evicts it
+        self.system_message: Optional[dict] = None
+        self.conversation_history: deque[dict] = deque(maxlen=MAX_HISTORY_TURNS * 2)
+        # Running summary of turns that fell out of the window
+        self.summary = ""
+        self.unsummarized: list[dict] = []
+        self.summary_task: Optional[asyncio.Task] = None
+        self.user_turn_count = 0  # Applicant replies so far (history is bounded)
         self.is_active = True
         self.is_speaking = False  # Bot is currently speaking
         self.interview_complete = False
         
         # Transcript for final analysis
         self.transcript_lines: list[str] = []
+        self._transcript = io.StringIO()  # Same lines, joined as they arrive
         
         # Report tracking
         self.report_sent = False  # Prevent duplicate reports
+        
+        # Background embed sends to the text channel
+        self.pending_sends: set[asyncio.Task] = set()
+        self.last_send: Optional[asyncio.Task] = None
+
+    def add_transcript_line(self, line: str):
+        """Record a transcript line, keeping the joined transcript up to date."""
+        if self.transcript_lines:
+            self._transcript.write("\n")
+        self._transcript.write(line)
+        self.transcript_lines.append(line)
+
+    @property
+    def transcript(self) -> str:
+        """The full transcript, one line per utterance."""
+        return self._transcript.getvalue()
+
+    def add_turn(self, role: str, content: str):
+        """Append a message, setting aside the one it evicts for summarizing."""
+        history = self.conversation_history
+        if len(history) == history.maxlen:
+            self.unsummarized.append(history[0])
+        history.append({"role": role, "content": content})
 
 
 class VoiceCog(commands.Cog):
@@ -269,19 +584,115 @@ class VoiceCog(commands.Cog):
 
     def __init__(self, bot):
         self.bot = bot
-        self.transcription = TranscriptionService()
-        self.analysis = AnalysisService()
-        self.tts = get_tts_service()
         
         # Silence detection settings
         self.silence_threshold = 2.0  # 2 seconds of silence before sending to LLM
-        self.check_interval = 0.2  # Check audio every 200ms (faster detection)
+        self.session_check_interval = 1.0  # Max wait before re-checking the session is still active
+        
+        # Services are created on first use; warm them up in the background
+        self._warmup_task = asyncio.create_task(self._warmup())
+        
+        # Only re-read interview-config.md when it changes on disk
+        watch_interview_config()
+        
+        # Applicant role per guild: {guild_id: (role_name, role_id or None)}
+        self._applicant_role_cache: dict[int, tuple[str, Optional[int]]] = {}
+        
+        # Opening questions keyed by system prompt hash (loaded lazily)
+        self._opening_questions: Optional[dict[str, str]] = None
+        
+        # Shared HTTP session for OpenRouter - keeps connections warm between turns
+        self._http: Optional[aiohttp.ClientSession] = None
+        self._preconnect_task: Optional[asyncio.Task] = None
         
         # OpenRouter settings - use :nitro suffix for maximum throughput
         self.openrouter_key = os.getenv("OPENROUTER_API_KEY")
         # Claude Haiku 4.5:nitro for fastest real-time conversation
         self.openrouter_model = os.getenv("OPENROUTER_MODEL", "anthropic/claude-haiku-4.5:nitro")
 
+    @cached_property
+    def transcription(self) -> TranscriptionService:
+        return TranscriptionService()
+
+    @cached_property
+    def analysis(self) -> AnalysisService:
+        return AnalysisService()
+
+    @cached_property
+    def tts(self) -> TTSService:
+        return get_tts_service()
+
+    def cog_unload(self):
+        self._warmup_task.cancel()
+        stop_watching_interview_config()
+        asyncio.create_task(self.close_http())
+
+    async def close_http(self):
+        """Close the shared HTTP sessions (ours and the services')."""
+        if self._http and not self._http.closed:
+            await self._http.close()
+        if "analysis" in self.__dict__:
+            await self.analysis.close()
+        if "transcription" in self.__dict__:
+            await self.transcription.close()
+
+    async def _get_http(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=30,
+                    ttl_dns_cache=300,
+                ),
+                timeout=OPENROUTER_TIMEOUT,
+            )
+        return self._http
+
+    async def _warmup(self):
+        """Create the services off the load path, then pre-synthesize static phrases."""
+        await asyncio.sleep(0)  # Let cog loading finish first
+        self.transcription
+        self.analysis
+        await self._prewarm_tts()
+
+    async def _prewarm_tts(self):
+        """Synthesize the fixed interview phrases so they play without a TTS round trip."""
+        if not self.tts.available:
+            return
+        
+        # Loaded from the TTS disk cache after the first start; the service
+        # keeps them in memory and serves them from synthesize()
+        prepared = await self.tts.prewarm(
+            self._clean_for_speech(phrase) for phrase in STATIC_PHRASES
+        )
+        logger.info(f"Pre-synthesized {len(prepared)}/{len(STATIC_PHRASES)} static phrases")
+
+    def _get_applicant_role_id(self, guild: discord.Guild) -> Optional[int]:
+        """Look up the applicant role's ID, caching it per guild and role name."""
+        role_name = self.bot.applicant_role_name
+        cached = self._applicant_role_cache.get(guild.id)
+        if cached is not None and cached[0] == role_name:
+            return cached[1]
+        
+        role = discord.utils.get(guild.roles, name=role_name)
+        role_id = role.id if role else None
+        self._applicant_role_cache[guild.id] = (role_name, role_id)
+        return role_id
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        self._applicant_role_cache.pop(role.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._applicant_role_cache.pop(after.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._applicant_role_cache.pop(role.guild.id, None)
+
     async def handle_voice_update(
         self,
         member: discord.Member,
@@ -295,12 +706,9 @@ class VoiceCog(commands.Cog):
             return
 
         # Check for applicant role
-        applicant_role = discord.utils.get(
-            member.guild.roles,
-            name=self.bot.applicant_role_name,
-        )
+        applicant_role_id = self._get_applicant_role_id(member.guild)
         
-        if not applicant_role or applicant_role not in member.roles:
+        if applicant_role_id is None or member.get_role(applicant_role_id) is None:
             return
 
         logger.info(f"Applicant detected: {member.display_name}")
@@ -331,6 +739,9 @@ class VoiceCog(commands.Cog):
             text_channel = channel.guild.text_channels[0] if channel.guild.text_channels else None
 
         session = InterviewSession(channel, applicant, text_channel)
+        
+        # Open the OpenRouter connection while we join voice
+        self._preconnect_task = asyncio.create_task(self._preconnect())
 
         try:
             session.connection = await channel.connect()
@@ -347,6 +758,17 @@ class VoiceCog(commands.Cog):
                 await session.connection.disconnect()
             self.bot.active_sessions.pop(channel.id, None)
 
+    async def _preconnect(self):
+        """Warm the shared HTTP pool (DNS, TCP, TLS) so the first LLM call skips the handshake."""
+        if not self.openrouter_key:
+            return
+        try:
+            http = await self._get_http()
+            async with http.head("https://openrouter.ai/api/v1/models"):
+                pass
+        except Exception as e:
+            logger.debug(f"OpenRouter preconnect failed: {e}")
+
     async def _run_conversation(self, session: InterviewSession):
         """Run the conversational interview loop."""
         import random
@@ -356,26 +778,25 @@ class VoiceCog(commands.Cog):
             
             # Initialize conversation with system prompt (loads custom config)
             system_prompt = get_system_prompt()
-            session.conversation_history = [
-                {"role": "system", "content": system_prompt}
-            ]
+            session.system_message = {"role": "system", "content": system_prompt}
+            
+            # Generate the first question while the intro is being spoken
+            first_question_task = asyncio.create_task(
+                self._get_llm_response(session, is_initial=True)
+            )
             
             # === FORMAL INTRODUCTION ===
-            intro_message = (
-                f"Hello {session.applicant.display_name}! Welcome. "
-                f"This is the first stage of your application interview. "
-                f"I'll be asking you a few questions to get to know you better. "
-                f"Take as long as you need with your answers! "
-                f"If you have any questions after we're done, please direct them to the person who set up this interview."
+            greeting = f"Hello {session.applicant.display_name}! Welcome."
+            await self._speak_and_display(
+                session, f"{greeting} {INTRO_BODY}", speech_parts=[greeting, INTRO_BODY]
             )
-            await self._speak_and_display(session, intro_message)
             await asyncio.sleep(1.0)  # Reduced from 1.5s
             
             # First question - directly ask, no second greeting
-            await self._speak_and_display(session, "Alright, let's begin. First question:", add_to_transcript=False)
+            await self._speak_and_display(session, FIRST_QUESTION_LEAD_IN, add_to_transcript=False)
             await asyncio.sleep(0.3)
             
-            first_question = await self._get_llm_response(session, is_initial=True)
+            first_question = await first_question_task
             if first_question:
                 await self._speak_and_display(session, first_question)
             
@@ -393,23 +814,17 @@ class VoiceCog(commands.Cog):
                     logger.info(f"Applicant said: {user_response[:100]}...")
                     
                     # Add to conversation history
-                    session.conversation_history.append({
-                        "role": "user",
-                        "content": user_response
-                    })
-                    session.transcript_lines.append(f"[{session.applicant.display_name}]: {user_response}")
+                    session.add_turn("user", user_response)
+                    session.user_turn_count += 1
+                    session.add_transcript_line(f"[{session.applicant.display_name}]: {user_response}")
                     
-                    # Get LLM response (with timing)
-                    import time as _time
-                    _start = _time.time()
-                    llm_response = await self._get_llm_response(session)
-                    logger.info(f"LLM response took {_time.time() - _start:.1f}s")
+                    # Get LLM response - sentences are spoken as they stream in
+                    llm_response = await self._respond_streaming(session)
                     
                     if llm_response:
                         # Check if interview is complete
                         # BUT enforce minimum 5 questions before allowing end
                         if "[INTERVIEW_COMPLETE]" in llm_response:
-                            llm_response = llm_response.replace("[INTERVIEW_COMPLETE]", "").strip()
                             if question_number >= 5:
                                 session.interview_complete = True
                                 logger.info(f"Interview ending after {question_number} questions")
@@ -418,31 +833,27 @@ class VoiceCog(commands.Cog):
                                 logger.warning(f"LLM tried to end at question {question_number}, forcing continue")
                         
                         question_number += 1
-                        await self._speak_and_display(session, llm_response)
                 
                 else:
                     # No response detected (long silence with no speech)
-                    if len(session.conversation_history) < 4:
+                    if len(session.conversation_history) < 3:
                         # They haven't said anything yet - gentle prompt
-                        await self._speak_and_display(session, "Take your time! I'm here whenever you're ready.", add_to_transcript=False)
+                        await self._speak_and_display(session, SILENCE_REMINDER, add_to_transcript=False)
             
             # Interview complete
             if session.is_active:
                 logger.info(f"Interview complete, processing... (transcript lines: {len(session.transcript_lines)})")
                 
-                # Formal closing
-                closing_message = (
-                    f"That concludes our interview, {session.applicant.display_name}. "
-                    f"Thank you so much for taking the time to speak with me today. "
-                    f"I'll put together a summary for the team to review. "
-                    f"If you have any questions, please reach out to the person who set up this interview. "
-                    f"Take care!"
-                )
-                await self._speak_and_display(session, closing_message)
-                await asyncio.sleep(1)
+                # Formal closing - shown (and added to the transcript) first so the
+                # analysis can run while it is being spoken
+                farewell = f"That concludes our interview, {session.applicant.display_name}."
+                await self._display(session, f"{farewell} {CLOSING_BODY}")
                 
                 # Generate and post the report
-                await self._complete_interview(session)
+                report_task = asyncio.create_task(self._complete_interview(session))
+                await self._speak_parts(session, [farewell, CLOSING_BODY])
+                await asyncio.sleep(1)
+                await report_task
                 
         except asyncio.CancelledError:
             logger.info("Interview cancelled")
@@ -467,52 +878,61 @@ class VoiceCog(commands.Cog):
         
         try:
             # Start recording
-            session.sink = discord.sinks.WaveSink()
+            loop = asyncio.get_running_loop()
+            session.sink = ActivitySink(session.applicant.id, loop, session.pcm_buffer)
             session.connection.start_recording(
                 session.sink,
                 self._on_recording_done,
                 session.channel.id,
             )
             session.is_recording = True
-            session.last_audio_size = 0
-            session.silence_start = None
+            started_at = loop.time()
             
             logger.debug("Started recording, waiting for speech...")
             
-            # Monitor for silence
-            has_received_audio = False
-            
+            # Wait for speech, then for a gap in it - woken by the sink, not polling
             while session.is_active and session.is_recording:
-                await asyncio.sleep(self.check_interval)
-                
-                # Get current audio size
-                current_size = self._get_audio_size(session)
+                last_audio_at = session.sink.last_audio_at
                 
-                if current_size > session.last_audio_size:
-                    # Audio is being received
-                    has_received_audio = True
-                    session.silence_start = None
-                    session.last_audio_size = current_size
+                if last_audio_at is None:
+                    # Haven't started talking yet - give them time
+                    remaining = no_response_timeout - (loop.time() - started_at)
+                    if remaining <= 0:
+                        # Timeout with no response at all
+                        if not short_timeout:
+                            logger.info(f"No response for {no_response_timeout} seconds")
+                        break
+                    
+                    session.sink.audio_event.clear()
+                    try:
+                        await asyncio.wait_for(
+                            session.sink.audio_event.wait(),
+                            min(remaining, self.session_check_interval),
+                        )
+                    except asyncio.TimeoutError:
+                        pass
                 else:
-                    # No new audio
-                    if has_received_audio:
-                        # They were talking but stopped
-                        if session.silence_start is None:
-                            session.silence_start = time.time()
-                        elif time.time() - session.silence_start >= silence_threshold:
-                            # Silence threshold reached after speaking
-                            if not short_timeout:
-                                logger.info(f"{silence_threshold}s silence detected, processing...")
-                            break
-                    else:
-                        # Haven't started talking yet - give them time
-                        if session.silence_start is None:
-                            session.silence_start = time.time()
-                        elif time.time() - session.silence_start >= no_response_timeout:
-                            # Timeout with no response at all
-                            if not short_timeout:
-                                logger.info(f"No response for {no_response_timeout} seconds")
-                            break
+                    if session.sink.full_event.is_set():
+                        logger.warning(
+                            f"Answer reached the {MAX_UTTERANCE_SECONDS}s recording limit, "
+                            "transcribing what was captured"
+                        )
+                        break
+                    
+                    # They were talking - wait for the silence deadline (or a full buffer)
+                    remaining = silence_threshold - (loop.time() - last_audio_at)
+                    if remaining <= 0:
+                        # Silence threshold reached after speaking
+                        if not short_timeout:
+                            logger.info(f"{silence_threshold}s silence detected, processing...")
+                        break
+                    
+                    try:
+                        await asyncio.wait_for(session.sink.full_event.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            
+            has_received_audio = session.sink.last_audio_at is not None
             
             # Stop recording
             if session.is_recording and session.connection:
@@ -523,9 +943,11 @@ class VoiceCog(commands.Cog):
             
             # Transcribe if we got audio
             if has_received_audio and session.sink:
-                audio_bytes = self._extract_user_audio(session)
-                if audio_bytes:
-                    result = await self.transcription.transcribe_audio(audio_bytes)
+                pcm = session.sink.read_pcm()
+                if pcm:
+                    result = await self.transcription.transcribe_pcm(
+                        pcm, sample_rate=PCM_SAMPLE_RATE, channels=PCM_CHANNELS
+                    )
                     if result and result.get("transcript"):
                         return result["transcript"].strip()
             
@@ -541,235 +963,465 @@ class VoiceCog(commands.Cog):
                 session.is_recording = False
             return None
 
-    def _get_audio_size(self, session: InterviewSession) -> int:
-        """Get total audio data size from sink."""
-        if not session.sink or not session.sink.audio_data:
-            return 0
-        
-        total = 0
-        for user_id, audio in session.sink.audio_data.items():
-            member = session.guild.get_member(user_id)
-            if member and member.bot:
-                continue
-            if audio.file:
-                audio.file.seek(0, 2)  # Seek to end
-                total += audio.file.tell()
-        return total
-
-    def _extract_user_audio(self, session: InterviewSession) -> Optional[bytes]:
-        """Extract audio data from non-bot users."""
-        if not session.sink or not session.sink.audio_data:
-            return None
-        
-        combined = io.BytesIO()
-        for user_id, audio in session.sink.audio_data.items():
-            member = session.guild.get_member(user_id)
-            if member and member.bot:
-                continue
-            if audio.file:
-                audio.file.seek(0)
-                combined.write(audio.file.read())
-        
-        return combined.getvalue() if combined.tell() > 0 else None
-
     async def _on_recording_done(self, sink, channel_id: int, *args):
         """Callback when recording stops. Must be async for py-cord."""
         # This callback is called from py-cord's thread via run_coroutine_threadsafe
         # The actual processing happens in _record_until_silence after we stop recording
         pass
 
-    async def _get_llm_response(self, session: InterviewSession, is_initial: bool = False) -> Optional[str]:
-        """Get a response from the LLM via OpenRouter with retry logic."""
+    def _load_opening_questions(self) -> dict[str, str]:
+        """Get the opening question cache, reading it from disk on first use."""
+        if self._opening_questions is None:
+            try:
+                self._opening_questions = json.loads(
+                    OPENING_QUESTION_CACHE_PATH.read_text(encoding="utf-8")
+                )
+            except (OSError, json.JSONDecodeError):
+                self._opening_questions = {}
+        return self._opening_questions
+
+    async def _save_opening_question(self, key: str, question: str):
+        """Remember an opening question and persist the cache."""
+        cache = self._load_opening_questions()
+        cache[key] = question
+        
+        def write():
+            OPENING_QUESTION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            OPENING_QUESTION_CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+        
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            logger.warning(f"Failed to save opening question cache: {e}")
+
+    async def _respond_streaming(self, session: InterviewSession) -> Optional[str]:
+        """Get the next LLM turn, speaking each sentence as soon as it's complete.
+        
+        Three stages run concurrently: the LLM stream feeds sentences to a
+        synthesis worker, which feeds audio to a playback worker - so
+        sentence N+1 is being synthesized while sentence N plays. The full
+        response is displayed and added to the transcript once the stream ends.
+        """
+        sentences: asyncio.Queue = asyncio.Queue()
+        clips: asyncio.Queue = asyncio.Queue()
+        tts_worker = asyncio.create_task(self._tts_worker(sentences, clips))
+        playback_worker = asyncio.create_task(self._playback_worker(session, clips))
+        
+        try:
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            llm_response = await self._get_llm_response(session, on_sentence=sentences.put_nowait)
+            logger.info(f"LLM response took {loop.time() - start:.1f}s")
+        finally:
+            sentences.put_nowait(None)
+        
+        if llm_response:
+            await self._display(session, llm_response)
+        
+        await asyncio.gather(tts_worker, playback_worker)
+        return llm_response
+
+    async def _tts_worker(self, sentences: asyncio.Queue, clips: asyncio.Queue):
+        """Synthesize queued sentences in order until a None sentinel arrives."""
+        try:
+            while True:
+                sentence = await sentences.get()
+                if sentence is None:
+                    return
+                
+                speech_text = self._clean_for_speech(sentence)
+                if not speech_text:
+                    continue
+                
+                # FFmpeg starts decoding now, while the previous clip plays
+                source = await self._prepare(speech_text)
+                if source:
+                    clips.put_nowait(source)
+        finally:
+            clips.put_nowait(None)
+
+    async def _playback_worker(self, session: InterviewSession, clips: asyncio.Queue):
+        """Play prepared clips in order until a None sentinel arrives."""
+        try:
+            while True:
+                source = await clips.get()
+                if source is None:
+                    return
+                
+                session.is_speaking = True
+                try:
+                    await self._play(session, source)
+                finally:
+                    session.is_speaking = False
+        finally:
+            # Don't leave FFmpeg processes behind for clips we never played
+            while not clips.empty():
+                source = clips.get_nowait()
+                if source:
+                    source.cleanup()
+
+    async def _read_stream(self, response: aiohttp.ClientResponse, on_sentence: Callable[[str], None]) -> str:
+        """Read an OpenRouter SSE stream, emitting each complete sentence.
+        
+        Returns:
+            The full response text
+        """
+        parts: list[str] = []
+        buffer = ""
+        
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data:"):
+                continue  # Blank lines and ": keep-alive" comments
+            
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            
+            try:
+                chunk = fastjson.loads(data)
+            except fastjson.JSONDecodeError:
+                continue
+            
+            choices = chunk.get("choices") or []
+            delta = choices[0].get("delta", {}).get("content") if choices else None
+            if not delta:
+                continue
+            
+            parts.append(delta)
+            buffer += delta
+            complete, buffer = split_sentences(buffer)
+            for sentence in complete:
+                on_sentence(sentence)
+        
+        # Flush whatever is left when the stream ends
+        if buffer.strip():
+            on_sentence(buffer.strip())
+        
+        return "".join(parts).strip()
+
+    def _maybe_summarize(self, session: InterviewSession):
+        """Fold evicted turns into the running summary in the background."""
+        if len(session.unsummarized) < SUMMARY_BATCH_MESSAGES:
+            return
+        if session.summary_task and not session.summary_task.done():
+            return
+        session.summary_task = asyncio.create_task(self._summarize_older(session))
+
+    async def _summarize_older(self, session: InterviewSession):
+        """Update session.summary with the turns that fell out of the window."""
+        turns = list(session.unsummarized)
+        name = session.applicant.display_name
+        exchanges = "\n".join(
+            f"[{'StaffLens' if m['role'] == 'assistant' else name}]: {m['content']}"
+            for m in turns
+        )
+        
+        try:
+            http = await self._get_http()
+            async with http.post(
+                "https://openrouter.ai/api/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.openrouter_key}",
+                    "Content-Type": "application/json",
+                },
+                data=fastjson.dumps({
+                    "model": self.openrouter_model,
+                    "messages": [
+                        {"role": "system", "content": SUMMARY_PROMPT},
+                        {"role": "user", "content": f"Earlier notes: {session.summary or '(none)'}\n\nNew exchanges:\n{exchanges}"},
+                    ],
+                    "max_tokens": 200,
+                    "temperature": 0,
+                }),
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"Summary request failed with {response.status}")
+                    return
+                data = fastjson.loads(await response.read())
+            
+            summary = data["choices"][0]["message"]["content"].strip()
+            if summary:
+                session.summary = summary
+                del session.unsummarized[:len(turns)]
+                logger.debug(f"Summarized {len(turns)} older messages")
+        except Exception as e:
+            logger.warning(f"Failed to summarize older turns: {e}")
+
+    def _use_cached_response(self, session: InterviewSession, text: str) -> str:
+        """Record a cached reply as the assistant's turn."""
+        session.add_turn("assistant", text)
+        return text
+
+    async def _get_llm_response(
+        self,
+        session: InterviewSession,
+        is_initial: bool = False,
+        on_sentence: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """Get a response from the LLM via OpenRouter with retry logic.
+        
+        Args:
+            session: The interview session
+            is_initial: Prompt for the opening question
+            on_sentence: If given, stream the response and call this with each
+                complete sentence as it arrives
+        """
         if not self.openrouter_key:
             logger.error("OpenRouter API key not configured")
             return None
         
+        # The opening question only depends on the system prompt - reuse it
+        opening_key = None
+        if is_initial:
+            opening_key = hashlib.sha256(
+                f"{session.system_message['content']}\x00{OPENING_PROMPT}".encode("utf-8")
+            ).hexdigest()
+            cached = self._load_opening_questions().get(opening_key)
+            if cached:
+                logger.info("Using cached opening question")
+                return self._use_cached_response(session, cached)
+        
+        self._maybe_summarize(session)
+        
+        messages = [session.system_message]
+        if session.summary:
+            messages.append({"role": "system", "content": f"Prior context: {session.summary}"})
+        messages.extend(session.conversation_history)
+        
+        if is_initial:
+            # Prompt for the opening question
+            messages.append({"role": "user", "content": OPENING_PROMPT})
+        
+        messages = with_prompt_caching(fit_to_budget(messages))
+        
+        # Encode once - retries resend the same bytes
+        body = fastjson.dumps({
+            "model": self.openrouter_model,
+            "messages": messages,
+            "max_tokens": 200,  # Keep responses short for speech
+            "temperature": 0.7,
+            "stream": on_sentence is not None,
+            # Compress the middle of the prompt rather than fail if it ever overflows
+            "transforms": ["middle-out"],
+            # SPEED OPTIMIZATION: Route to lowest latency provider
+            "provider": {
+                "sort": "latency",  # Prioritize fastest response time
+                "preferred_max_latency": {"p90": 3.0},  # 90% under 3s
+            },
+        })
+        
+        # Sentences already handed to TTS - once any are out, a retry would
+        # repeat them aloud, so a failure keeps what was said instead
+        spoken: list[str] = []
+        
+        def emit(sentence: str):
+            spoken.append(sentence)
+            on_sentence(sentence)
+        
         max_retries = 3
         
         for attempt in range(max_retries):
             try:
-                messages = session.conversation_history.copy()
-                
-                if is_initial:
-                    # Prompt for initial greeting
-                    messages.append({
-                        "role": "user",
-                        "content": f"[SYSTEM: A new applicant named {session.applicant.display_name} has just joined the voice channel. Greet them warmly and begin the interview. Remember to keep it short since this will be spoken aloud.]"
-                    })
-                
-                async with aiohttp.ClientSession() as http:
-                    async with http.post(
-                        "https://openrouter.ai/api/v1/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.openrouter_key}",
-                            "Content-Type": "application/json",
-                        },
-                        json={
-                            "model": self.openrouter_model,
-                            "messages": messages,
-                            "max_tokens": 200,  # Keep responses short for speech
-                            "temperature": 0.7,
-                            # SPEED OPTIMIZATION: Route to lowest latency provider
-                            "provider": {
-                                "sort": "latency",  # Prioritize fastest response time
-                                "preferred_max_latency": {"p90": 3.0},  # 90% under 3s
-                            },
-                        },
-                        timeout=aiohttp.ClientTimeout(total=15),  # Reduced from 30s
-                    ) as response:
-                        if response.status == 520 or response.status >= 500:
-                            error = await response.text()
-                            logger.warning(f"OpenRouter error {response.status} (attempt {attempt + 1}/{max_retries}): {error}")
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(1)  # Wait before retry
-                                continue
-                            return None
-                        
-                        if response.status != 200:
-                            error = await response.text()
-                            logger.error(f"OpenRouter error {response.status}: {error}")
-                            return None
-                        
-                        data = await response.json()
+                http = await self._get_http()
+                async with http.post(
+                    "https://openrouter.ai/api/v1/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.openrouter_key}",
+                        "Content-Type": "application/json",
+                    },
+                    data=body,
+                ) as response:
+                    if response.status == 429 or response.status >= 500:
+                        error = await response.text()
+                        logger.warning(f"OpenRouter error {response.status} (attempt {attempt + 1}/{max_retries}): {error}")
+                        if attempt < max_retries - 1:
+                            # Back off (or wait as long as the provider asks) before retrying
+                            await asyncio.sleep(backoff_delay(attempt, response.headers.get("Retry-After")))
+                            continue
+                        return None
+                    
+                    if response.status != 200:
+                        error = await response.text()
+                        logger.error(f"OpenRouter error {response.status}: {error}")
+                        return None
+                    
+                    if on_sentence:
+                        llm_response = await self._read_stream(response, emit)
+                    else:
+                        data = fastjson.loads(await response.read())
                         llm_response = data["choices"][0]["message"]["content"].strip()
-                        
-                        # Add to conversation history
-                        session.conversation_history.append({
-                            "role": "assistant",
-                            "content": llm_response
-                        })
-                        
-                        return llm_response
-                        
+                    
+                    # Add to conversation history
+                    session.add_turn("assistant", llm_response)
+                    
+                    # The opener was asked for without any applicant details
+                    if opening_key:
+                        await self._save_opening_question(opening_key, llm_response)
+                    
+                    return llm_response
+                    
             except asyncio.TimeoutError:
                 logger.warning(f"OpenRouter timeout (attempt {attempt + 1}/{max_retries})")
+                if spoken:
+                    return self._keep_partial(session, spoken)
                 if attempt < max_retries - 1:
                     continue
                 return None
             except Exception as e:
                 logger.error(f"LLM request failed: {e}")
+                if spoken:
+                    return self._keep_partial(session, spoken)
                 return None
         
         return None
 
+    def _keep_partial(self, session: InterviewSession, spoken: list[str]) -> str:
+        """Record the sentences already spoken from a broken stream as the assistant's turn."""
+        partial = " ".join(spoken)
+        logger.warning(f"Stream broke after {len(spoken)} sentence(s) - keeping the partial response")
+        session.add_turn("assistant", partial)
+        return partial
+
     def _clean_for_speech(self, text: str) -> str:
         """Remove roleplay actions, URLs, and other non-speech text for TTS."""
-        import re
-        
-        # STRIP ALL URLS - http, https, www, domains
-        cleaned = re.sub(r'https?://\S+', '', text)
-        cleaned = re.sub(r'www\.\S+', '', cleaned)
-        cleaned = re.sub(r'\S+\.(com|org|net|io|gg|co|dev|ai)\S*', '', cleaned)
-        
-        # Remove "check out [something]" phrases that reference websites
-        cleaned = re.sub(r'check out \S+', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'visit \S+', '', cleaned, flags=re.IGNORECASE)
-        
-        # Remove *action* style roleplay markers
-        cleaned = re.sub(r'\*[^*]+\*', '', cleaned)
-        # Remove _action_ style markers
-        cleaned = re.sub(r'_[^_]+_', '', cleaned)
-        # Remove control markers and system notes in brackets
-        cleaned = cleaned.replace('[INTERVIEW_COMPLETE]', '')
-        cleaned = cleaned.replace('[PAUSE]', '')
-        cleaned = re.sub(r'\[pause\]', '', cleaned, flags=re.IGNORECASE)
-        # Remove ANY bracketed content (LLM system notes, thinking, etc.)
-        cleaned = re.sub(r'\[SYSTEM:[^\]]*\]', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\[NOTE:[^\]]*\]', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\[INTERNAL:[^\]]*\]', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\[THINKING:[^\]]*\]', '', cleaned, flags=re.IGNORECASE)
-        # Catch-all for any remaining bracketed instructions/notes
-        cleaned = re.sub(r'\[[A-Z][A-Z\s]*:[^\]]*\]', '', cleaned)
-        # Clean up extra whitespace
-        cleaned = ' '.join(cleaned.split())
-        return cleaned.strip()
+        return clean_output(text)[1]
 
     def _clean_for_display(self, text: str) -> str:
         """Remove URLs and control markers for display."""
-        import re
-        
-        # STRIP ALL URLS
-        cleaned = re.sub(r'https?://\S+', '[link removed]', text)
-        cleaned = re.sub(r'www\.\S+', '[link removed]', cleaned)
-        cleaned = re.sub(r'\S+\.(com|org|net|io|gg|co|dev|ai)\S*', '[link removed]', cleaned)
-        
-        # Remove control markers
-        cleaned = cleaned.replace('[INTERVIEW_COMPLETE]', '')
-        return cleaned.strip()
+        return clean_output(text)[0]
 
-    async def _speak_and_display(self, session: InterviewSession, text: str, add_to_transcript: bool = True):
+    async def _speak_and_display(
+        self,
+        session: InterviewSession,
+        text: str,
+        add_to_transcript: bool = True,
+        speech_parts: Optional[list[str]] = None,
+    ):
         """Speak the text via TTS and display in text channel for accessibility.
         
         Args:
             session: The interview session
             text: Text to speak and display
             add_to_transcript: If False, don't add to transcript (for confirmation prompts)
+            speech_parts: Speak these pieces in order instead of `text`, so the
+                fixed pieces can come from the pre-synthesized cache
         """
         if not text:
             return
         
+        await self._display(session, text, add_to_transcript)
+        await self._speak_parts(session, speech_parts or [text])
+
+    async def _speak_parts(self, session: InterviewSession, parts: list[str]):
+        """Speak each piece in order via TTS (cleaned of roleplay actions)."""
+        if not session.connection or not session.connection.is_connected():
+            return
+        
+        # Start FFmpeg for every part up front so each one plays right after the last
+        sources = [await self._prepare(self._clean_for_speech(part)) for part in parts]
+        
+        session.is_speaking = True
+        try:
+            for source in sources:
+                if source:
+                    await self._play(session, source)
+        finally:
+            session.is_speaking = False
+
+    async def _display(self, session: InterviewSession, text: str, add_to_transcript: bool = True):
+        """Show the text in the text channel and record it in the transcript."""
         # Clean text for display (remove URLs and control markers)
         display_text = self._clean_for_display(text)
         
         # Add to transcript (unless it's a confirmation prompt)
         if add_to_transcript:
-            session.transcript_lines.append(f"[StaffLens]: {display_text}")
+            session.add_transcript_line(f"[StaffLens]: {display_text}")
         
-        # Display in text channel for accessibility
+        # Display in text channel for accessibility - sent in the background
+        # so speech doesn't wait on the Discord round trip
         if session.text_channel:
-            try:
-                embed = discord.Embed(
-                    description=f"🎙️ **StaffLens:** {display_text}",
-                    color=0x5865F2
-                )
-                embed.set_footer(text=f"Interview with {session.applicant.display_name}")
-                await session.text_channel.send(embed=embed)
-            except Exception as e:
-                logger.error(f"Failed to send text: {e}")
-        
-        # Clean text for speech (remove roleplay actions)
-        speech_text = self._clean_for_speech(text)
-        
-        # Speak via TTS
-        session.is_speaking = True
+            embed = discord.Embed(
+                description=f"🎙️ **StaffLens:** {display_text}",
+                color=0x5865F2
+            )
+            embed.set_footer(text=f"Interview with {session.applicant.display_name}")
+            
+            task = asyncio.create_task(self._send_embed(session, embed, session.last_send))
+            session.last_send = task
+            session.pending_sends.add(task)
+            task.add_done_callback(session.pending_sends.discard)
+
+    async def _send_embed(
+        self,
+        session: InterviewSession,
+        embed: discord.Embed,
+        previous: Optional[asyncio.Task],
+    ):
+        """Send an embed to the session's text channel after the previous one."""
+        if previous:
+            await asyncio.gather(previous, return_exceptions=True)  # Keep message order
         try:
-            await self._speak(session, speech_text)
-        finally:
-            session.is_speaking = False
+            await session.text_channel.send(embed=embed)
+        except Exception as e:
+            logger.error(f"Failed to send text: {e}")
 
     async def _speak(self, session: InterviewSession, text: str):
         """Speak text in the voice channel using TTS."""
         if not session.connection or not session.connection.is_connected():
             return
         
+        source = await self._prepare(text)
+        if source:
+            await self._play(session, source)
+
+    async def _prepare(self, text: str) -> Optional[discord.AudioSource]:
+        """
+        Synthesize the text and start FFmpeg decoding it.
+        
+        Spawning FFmpeg is the slow part of starting playback, so callers
+        prepare the next clip while the current one is still playing.
+        """
         try:
             audio_data = await self.tts.synthesize(text)
             if not audio_data:
-                return
+                return None
+            # Feed the MP3 to FFmpeg over stdin - no temp file round trip
+            return await asyncio.to_thread(
+                discord.FFmpegPCMAudio, io.BytesIO(audio_data), pipe=True
+            )
+        except Exception as e:
+            logger.error(f"Speech error: {e}")
+            return None
+
+    async def _play(self, session: InterviewSession, source: discord.AudioSource):
+        """Play a prepared clip in the voice channel and wait for it to finish."""
+        if not session.connection or not session.connection.is_connected():
+            source.cleanup()
+            return
+        
+        try:
+            if session.connection.is_playing():
+                session.connection.stop()
             
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-                f.write(audio_data)
-                temp_path = f.name
+            # py-cord calls after() from its player thread when playback ends
+            loop = asyncio.get_running_loop()
+            finished = loop.create_future()
             
-            try:
-                source = discord.FFmpegPCMAudio(temp_path)
-                
-                if session.connection.is_playing():
-                    session.connection.stop()
-                
-                session.connection.play(source)
-                
-                while session.connection.is_playing():
-                    await asyncio.sleep(0.1)
-                    
-            finally:
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
+            def after(error: Optional[Exception]):
+                loop.call_soon_threadsafe(
+                    lambda: finished.done() or finished.set_result(error)
+                )
+            
+            session.connection.play(source, after=after)
+            
+            error = await finished
+            if error:
+                logger.error(f"Playback error: {error}")
                     
         except Exception as e:
             logger.error(f"Speech error: {e}")
+            source.cleanup()
 
     async def _complete_interview(self, session: InterviewSession):
         """Process completed interview - analyze and post report."""
@@ -781,7 +1433,7 @@ class VoiceCog(commands.Cog):
             return
         session.report_sent = True
         
-        transcript = "\n".join(session.transcript_lines)
+        transcript = session.transcript
         
         if not transcript.strip():
             logger.warning("Empty transcript, skipping analysis")
@@ -795,24 +1447,18 @@ class VoiceCog(commands.Cog):
         logger.info(f"Processing transcript ({len(transcript)} chars)")
         logger.info(f"Transcript preview: {transcript[:200]}...")
         
-        # Save to database
+        # Store the transcript before analysis starts, so a shutdown mid-analysis
+        # can't lose the interview; the insert runs while the model works
+        save_task = asyncio.create_task(self._save_transcript(session, transcript))
+        
+        logger.info("Running AI analysis...")
         try:
-            interview_id = await self.bot.db.save_transcript(
-                applicant_id=session.applicant.id,
-                applicant_name=session.applicant.display_name,
-                guild_id=session.guild.id,
-                channel_name=session.channel.name,
-                transcript=transcript,
-                started_at=session.started_at,
-            )
-            logger.info(f"Saved transcript with ID: {interview_id}")
+            analysis = await self.analysis.analyze_transcript(transcript)
         except Exception as e:
-            logger.error(f"Failed to save transcript: {e}")
-            interview_id = None
+            logger.error(f"Analysis failed: {e}")
+            analysis = None
         
-        # Analyze with the dedicated analysis service
-        logger.info("Running AI analysis...")
-        analysis = await self.analysis.analyze_transcript(transcript)
+        interview_id = await save_task
         
         if not analysis:
             logger.error("Analysis failed - no result returned")
@@ -824,15 +1470,41 @@ class VoiceCog(commands.Cog):
         
         logger.info(f"Analysis complete: fit_score={analysis.get('fit_score')}, recommendation={analysis.get('recommendation')}")
         
-        # Save analysis
-        if interview_id:
-            try:
-                await self.bot.db.save_analysis(interview_id, analysis)
-                logger.info("Analysis saved to database")
-            except Exception as e:
-                logger.error(f"Failed to save analysis: {e}")
-        
-        # Post report
+        # Attach the analysis to the saved interview and post the report concurrently
+        await asyncio.gather(
+            self._save_analysis(interview_id, analysis),
+            self._post_report(session, analysis, transcript),
+        )
+
+    async def _save_transcript(self, session: InterviewSession, transcript: str) -> Optional[int]:
+        """Store the interview transcript, returning its ID (None if the save failed)."""
+        try:
+            interview_id = await self.bot.db.save_transcript(
+                applicant_id=session.applicant.id,
+                applicant_name=session.applicant.display_name,
+                guild_id=session.guild.id,
+                channel_name=session.channel.name,
+                transcript=transcript,
+                started_at=session.started_at,
+            )
+            logger.info(f"Saved transcript with ID: {interview_id}")
+            return interview_id
+        except Exception as e:
+            logger.error(f"Failed to save transcript: {e}")
+            return None
+
+    async def _save_analysis(self, interview_id: Optional[int], analysis: dict):
+        """Store the analysis for a saved interview."""
+        if not interview_id:
+            return
+        try:
+            await self.bot.db.save_analysis(interview_id, analysis)
+            logger.info("Analysis saved to database")
+        except Exception as e:
+            logger.error(f"Failed to save analysis: {e}")
+
+    async def _post_report(self, session: InterviewSession, analysis: dict, transcript: str):
+        """Post the interview report embed to the report channel."""
         report_channel = self.bot.get_report_channel()
         logger.info(f"Report channel: {report_channel} (ID: {self.bot.report_channel_id})")
         
@@ -868,6 +1540,13 @@ class VoiceCog(commands.Cog):
     async def _cleanup_session(self, session: InterviewSession):
         """Clean up an interview session."""
         try:
+            if session.summary_task:
+                session.summary_task.cancel()
+            
+            # Let queued text messages go out before we leave
+            if session.pending_sends:
+                await asyncio.wait(session.pending_sends, timeout=10)
+            
             if session.is_recording and session.connection:
                 try:
                     session.connection.stop_recording()
@@ -913,8 +1592,8 @@ class VoiceCog(commands.Cog):
 
         lines = ["**Active Interviews:**"]
         for channel_id, session in self.bot.active_sessions.items():
-            duration = (datetime.utcnow() - session.started_at).seconds // 60
-            exchanges = len([m for m in session.conversation_history if m["role"] == "user"])
+            duration = int(time.monotonic() - session.started_monotonic) // 60
+            exchanges = session.user_turn_count
             lines.append(
                 f"• **{session.channel.name}** - "
                 f"{session.applicant.display_name} - "
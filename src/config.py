@@ -0,0 +1,33 @@
+"""
+Configuration - Bot settings loaded once from the environment.
+"""
+
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """
+    Immutable bot configuration.
+
+    Built once at startup; runtime changes (e.g. !setrole) are kept
+    as overrides on the bot rather than mutating this object.
+    """
+
+    token: str
+    command_prefix: str
+    report_channel_id: int
+    applicant_role_name: str
+    fit_threshold: int
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Load configuration from environment variables."""
+        return cls(
+            token=os.environ.get("DISCORD_TOKEN", ""),
+            command_prefix=os.environ.get("COMMAND_PREFIX", "!"),
+            report_channel_id=int(os.environ.get("REPORT_CHANNEL_ID", 0)),
+            applicant_role_name=os.environ.get("APPLICANT_ROLE_NAME", "Applicant"),
+            fit_threshold=int(os.environ.get("FIT_THRESHOLD", 70)),
+        )
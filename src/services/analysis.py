@@ -6,24 +6,83 @@ falls back to OpenRouter API for analysis.
 """
 
 import os
+import re
 import json
+import hashlib
 import logging
 import asyncio
-from typing import Optional
+import copy
+import importlib.util
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import AsyncIterator, Optional
 
 import aiohttp
 
+from src.utils import fastjson
+from src.utils.retry import backoff_delay
+
+# httpx multiplexes concurrent OpenRouter calls over one HTTP/2 connection
+# (needs the h2 package from the httpx[http2] extra)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+if httpx and importlib.util.find_spec("h2") is None:
+    httpx = None
+
 logger = logging.getLogger("stafflens.analysis")
 
-# Analysis prompt template - Workplace Psychologist framing
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# Applicant transcripts shorter than this (in words) aren't sent to the LLM
+MIN_TRANSCRIPT_WORDS = 30
+
+# Analysis runs after the interview, so it can wait out longer provider backoffs
+ANALYSIS_MAX_RETRY_DELAY = 30.0
+
+# Normalized results kept for re-runs of the same transcript
+ANALYSIS_CACHE_SIZE = 512
+
+# Transcript compression: interviewer turns (only the applicant is assessed)
+# and redundant whitespace are dropped before the LLM sees it.
+# A turn runs until the next "[speaker]:" line, so multi-line turns go whole.
+_INTERVIEWER_TURN_RE = re.compile(
+    r"^\[StaffLens\]:.*?(?=^\[[^\]\n]+\]:|\Z)", re.MULTILINE | re.DOTALL
+)
+_INLINE_SPACE_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+
+# Markdown code fence around the model's JSON (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Map recommendation to boolean for backward compatibility
+RECOMMENDATION_MAP = MappingProxyType({
+    "STRONG_HIRE": True,
+    "HIRE": True,
+    "LEAN_HIRE": True,
+    "LEAN_NO": False,
+    "NO_HIRE": False,
+    "STRONG_NO": False,
+})
+
+# Pulls the first JSON object out of surrounding prose (C-implemented, string-aware)
+_JSON_DECODER = json.JSONDecoder()
+
+# Errors from either HTTP client that are worth retrying
+HTTP_ERRORS = (aiohttp.ClientError, httpx.HTTPError) if httpx else (aiohttp.ClientError,)
+
+# Analysis instructions - Workplace Psychologist framing. Kept free of any
+# per-call text so it's a byte-identical prefix the provider can cache;
+# the transcript goes in a separate user message after it
 ANALYSIS_PROMPT = """You are the world's foremost workplace psychologist, renowned for your ability to assess candidates through conversational analysis. You're analyzing a voice interview transcript to determine personality traits and cultural fit.
 
 **CRITICAL - READ FIRST:**
-The transcript contains TWO speakers:
-- Lines starting with [StaffLens]: are the AI INTERVIEWER asking questions - IGNORE THESE for analysis
-- Lines starting with any other name (e.g., [chad]:, [john]:) are the APPLICANT's responses - ONLY ANALYZE THESE
+The transcript contains ONLY the APPLICANT's responses, in order. The AI interviewer's questions have been removed.
+- Each line starts with the applicant's name (e.g., [chad]:, [john]:) followed by one spoken answer
+- Judge each answer on its own content - don't penalize the applicant for context the missing questions would have supplied
 
-You are assessing the APPLICANT only. Never quote or analyze what [StaffLens] said.
+You are assessing the APPLICANT only. Every line is theirs to analyze and quote.
 
 **THE CULTURE:**
 This is a community-driven, growth-oriented entrepreneurial Discord server. We value:
@@ -35,7 +94,7 @@ This is a community-driven, growth-oriented entrepreneurial Discord server. We v
 - Resilience under ambiguity
 
 **YOUR ASSESSMENT TASK:**
-Analyze the APPLICANT's interview responses (NOT the interviewer's questions) across these dimensions:
+Analyze the APPLICANT's interview responses across these dimensions:
 
 1. **Communication Clarity** (1-10): How articulate and coherent are their thoughts? Do they structure responses well?
 2. **Confidence & Assertiveness** (1-10): Do they speak with conviction? Are they decisive without being arrogant?
@@ -50,36 +109,99 @@ Analyze the APPLICANT's interview responses (NOT the interviewer's questions) ac
    - Entitlement or arrogance
    - Blame-shifting
 
-**TRANSCRIPT:**
-{transcript}
-
 **STANDARD OF EXCELLENCE:**
 We hold a high bar. A candidate should demonstrate genuine enthusiasm, self-awareness, and collaborative instincts. When in doubt, protect the culture.
 
 **OUTPUT FORMAT:**
-Return ONLY valid JSON with this exact structure. ALL QUOTES MUST BE FROM THE APPLICANT, NEVER FROM [StaffLens]:
-{{
-    "scores": {{
+The transcript follows in the next message. Return ONLY valid JSON with this exact structure. ALL QUOTES MUST BE VERBATIM FROM THE TRANSCRIPT:
+{
+    "scores": {
         "communication_clarity": <1-10>,
         "confidence": <1-10>,
         "problem_solving": <1-10>,
         "emotional_regulation": <1-10>,
         "cultural_fit": <1-10>
-    }},
+    },
     "fit_score": <1-100 weighted overall score>,
     "strengths": ["strength1", "strength2", "strength3"],
     "concerns": ["concern1", "concern2"],
     "red_flags": ["red_flag1", ...] or [],
-    "evidence_quotes": {{
+    "evidence_quotes": {
         "positive": ["direct quote FROM APPLICANT showing strength", "another quote FROM APPLICANT"],
         "negative": ["quote FROM APPLICANT showing concern", "another if applicable"]
-    }},
+    },
     "psychological_profile": "2-3 sentence personality/work style assessment of the APPLICANT",
     "culture_alignment": "1-2 sentences on how the APPLICANT would fit our specific culture",
     "summary": "2-3 sentence executive summary for hiring manager about the APPLICANT",
     "recommendation": "<STRONG_HIRE|HIRE|LEAN_HIRE|LEAN_NO|NO_HIRE|STRONG_NO>",
     "recommendation_reasoning": "1-2 sentences explaining your recommendation"
-}}"""
+}"""
+
+# Per-call user message carrying the transcript
+TRANSCRIPT_MESSAGE = """**TRANSCRIPT:**
+{transcript}
+
+Return ONLY the JSON object as specified."""
+
+
+def _extract_json(response_text: str) -> dict:
+    """
+    Parse the JSON object out of a model completion.
+
+    Args:
+        response_text: Completion text, possibly fenced or wrapped in prose
+
+    Returns:
+        The decoded object
+
+    Raises:
+        JSONDecodeError: If no valid JSON object is found
+    """
+    # Handle potential markdown code blocks
+    fence = _FENCE_RE.search(response_text)
+    json_str = fence.group(1) if fence else response_text
+
+    # Decode the first JSON object, ignoring any text around it
+    start_idx = json_str.find('{')
+    if start_idx != -1:
+        result, _ = _JSON_DECODER.raw_decode(json_str, start_idx)
+        return result
+    return fastjson.loads(json_str)
+
+
+async def _collect_stream(lines: AsyncIterator) -> str:
+    """
+    Join the content deltas of an OpenRouter SSE stream.
+
+    Args:
+        lines: Response lines (bytes from aiohttp, str from httpx)
+
+    Returns:
+        The full completion text
+    """
+    parts: list[str] = []
+    async for raw_line in lines:
+        line = raw_line.strip()
+        if isinstance(line, str):
+            line = line.encode()
+        if not line.startswith(b"data:"):
+            continue  # Blank lines and ": keep-alive" comments
+
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+
+        try:
+            chunk = fastjson.loads(data)
+        except fastjson.JSONDecodeError:
+            continue
+
+        choices = chunk.get("choices") or []
+        delta = choices[0].get("delta", {}).get("content") if choices else None
+        if delta:
+            parts.append(delta)
+
+    return "".join(parts)
 
 
 class AnalysisService:
@@ -108,7 +230,82 @@ class AnalysisService:
         # Timeout for local endpoint (seconds)
         self.local_timeout = int(os.getenv("LOCAL_ANALYSIS_TIMEOUT", 30))
 
-    async def analyze_transcript(self, transcript: str) -> Optional[dict]:
+        # Longer transcripts keep their start and end (fits the model's context)
+        self.max_transcript_chars = int(os.getenv("MAX_TRANSCRIPT_CHARS", 40000))
+
+        # {sha256(model + transcript): normalized result}, least recently used first
+        self._cache: OrderedDict[str, dict] = OrderedDict()
+
+        # Shared HTTP clients (created lazily on the bot's event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._client = None  # httpx.AsyncClient when httpx is installed
+
+    async def _session_get(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=60,
+                    ttl_dns_cache=300,
+                ),
+                timeout=aiohttp.ClientTimeout(total=60),
+            )
+        return self._session
+
+    def _client_get(self):
+        """Get the shared HTTP/2 client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def _post_openrouter(self, payload: dict, headers: dict) -> tuple[int, str, Optional[str]]:
+        """
+        Stream a chat completion from OpenRouter.
+
+        Uses the HTTP/2 client when httpx is installed, otherwise the
+        shared aiohttp session. The completion is assembled from the SSE
+        deltas as they arrive instead of buffering one large body.
+
+        Args:
+            payload: Request body (sent with "stream": true)
+            headers: Request headers
+
+        Returns:
+            (status code, completion text - or the error body on failure,
+            Retry-After header if any)
+        """
+        body = fastjson.dumps({**payload, "stream": True})
+        if httpx:
+            async with self._client_get().stream(
+                "POST", OPENROUTER_URL, content=body, headers=headers
+            ) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode(errors="replace")
+                    return response.status_code, error_text, response.headers.get("Retry-After")
+                return 200, await _collect_stream(response.aiter_lines()), None
+
+        session = await self._session_get()
+        async with session.post(OPENROUTER_URL, data=body, headers=headers) as response:
+            if response.status != 200:
+                return response.status, await response.text(), response.headers.get("Retry-After")
+            return 200, await _collect_stream(response.content), None
+
+    async def close(self):
+        """Close the shared HTTP clients."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def analyze_transcript(self, transcript: str, use_cache: bool = True) -> Optional[dict]:
         """
         Analyze a transcript and return structured assessment.
         
@@ -116,6 +313,8 @@ class AnalysisService:
         
         Args:
             transcript: Full interview transcript with speaker labels
+            use_cache: Reuse an earlier result for the same transcript. Pass
+                False to force a fresh model call (the new result is cached)
             
         Returns:
             Analysis result dict or None if analysis fails
@@ -124,17 +323,95 @@ class AnalysisService:
             logger.warning("Empty transcript provided")
             return None
 
+        transcript = self._preprocess_transcript(transcript)
+        if not transcript:
+            logger.warning("Transcript has no applicant responses")
+            return None
+
+        # Too little to assess - answer locally instead of paying for a round trip
+        if len(transcript.split()) < MIN_TRANSCRIPT_WORDS:
+            logger.info("Transcript too short for LLM analysis")
+            return self._minimal_result("Transcript too short for meaningful analysis.")
+
+        if len(transcript) > self.max_transcript_chars:
+            transcript = self._truncate_middle(transcript, self.max_transcript_chars)
+
+        key = hashlib.sha256(
+            (self.openrouter_model + "\x00" + transcript).encode()
+        ).hexdigest()
+        cached = self._cache.get(key) if use_cache else None
+        if cached is not None:
+            self._cache.move_to_end(key)
+            logger.info("Using cached analysis for identical transcript")
+            # Callers own their result - don't hand out the cached dict itself
+            return copy.deepcopy(cached)
+
         # Use OpenRouter directly (no local endpoint)
         logger.info("Analyzing transcript via OpenRouter...")
         result = await self._analyze_openrouter(transcript)
         
         if result:
             logger.info("OpenRouter analysis successful")
+            self._cache[key] = copy.deepcopy(result)
+            self._cache.move_to_end(key)
+            if len(self._cache) > ANALYSIS_CACHE_SIZE:
+                self._cache.popitem(last=False)
             return result
 
         logger.error("Analysis failed")
         return None
 
+    def _preprocess_transcript(self, transcript: str) -> str:
+        """
+        Shrink a transcript before it's sent for analysis.
+
+        Removes the interviewer's lines and collapses runs of spaces and
+        blank lines, keeping one applicant turn per line.
+
+        Args:
+            transcript: Full interview transcript with speaker labels
+
+        Returns:
+            Compressed transcript
+        """
+        compressed = _INTERVIEWER_TURN_RE.sub("", transcript)
+        compressed = _INLINE_SPACE_RE.sub(" ", compressed)
+        compressed = _BLANK_LINES_RE.sub("\n", compressed).strip()
+        logger.info(f"Transcript compressed from {len(transcript)} to {len(compressed)} chars")
+        return compressed
+
+    def _truncate_middle(self, transcript: str, max_chars: int) -> str:
+        """
+        Cut the middle out of an oversized transcript.
+
+        Args:
+            transcript: Compressed transcript
+            max_chars: Maximum length to keep
+
+        Returns:
+            The first and last parts of the transcript, joined by a marker
+        """
+        marker = "\n[... middle of interview omitted ...]\n"
+        keep = max(0, max_chars - len(marker)) // 2
+        logger.info(f"Transcript truncated from {len(transcript)} to ~{max_chars} chars")
+        return transcript[:keep] + marker + transcript[-keep:] if keep else transcript[:max_chars]
+
+    def _minimal_result(self, reason: str) -> dict:
+        """
+        Build a placeholder result for a transcript that wasn't analyzed.
+
+        Args:
+            reason: Why no analysis was run (shown as the summary)
+
+        Returns:
+            Normalized result dict with no scores
+        """
+        return self._normalize_result({
+            "summary": reason,
+            "recommendation": "LEAN_NO",
+            "recommendation_reasoning": reason,
+        })
+
     async def _analyze_local(self, transcript: str) -> Optional[dict]:
         """
         Send transcript to local ConversaTrait endpoint.
@@ -146,30 +423,29 @@ class AnalysisService:
             Analysis result or None
         """
         try:
-            timeout = aiohttp.ClientTimeout(total=self.local_timeout)
-            
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                payload = {
-                    "transcript": transcript,
-                    "analysis_type": "interview",
-                    "include_scores": True,
-                    "include_evidence": True,
-                }
-
-                async with session.post(
-                    self.local_endpoint,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return self._normalize_result(data)
-                    else:
-                        logger.warning(
-                            f"Local endpoint returned {response.status}: "
-                            f"{await response.text()}"
-                        )
-                        return None
+            session = await self._session_get()
+            payload = {
+                "transcript": transcript,
+                "analysis_type": "interview",
+                "include_scores": True,
+                "include_evidence": True,
+            }
+
+            async with session.post(
+                self.local_endpoint,
+                data=fastjson.dumps(payload),
+                headers={"Content-Type": "application/json"},
+                timeout=aiohttp.ClientTimeout(total=self.local_timeout),
+            ) as response:
+                if response.status == 200:
+                    data = await asyncio.to_thread(fastjson.loads, await response.read())
+                    return self._normalize_result(data)
+                else:
+                    logger.warning(
+                        f"Local endpoint returned {response.status}: "
+                        f"{await response.text()}"
+                    )
+                    return None
 
         except aiohttp.ClientConnectorError:
             logger.info("Local endpoint not available")
@@ -199,97 +475,71 @@ class AnalysisService:
         
         for attempt in range(max_retries):
             try:
-                prompt = ANALYSIS_PROMPT.format(transcript=transcript)
-
-                async with aiohttp.ClientSession() as session:
-                    payload = {
-                        "model": self.openrouter_model,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": prompt,
-                            }
-                        ],
-                        "temperature": 0.3,  # Lower for more consistent analysis
-                    }
-
-                    headers = {
-                        "Authorization": f"Bearer {self.openrouter_key}",
-                        "Content-Type": "application/json",
-                        "HTTP-Referer": os.getenv("APP_URL", "https://stafflens.local"),
-                        "X-Title": "StaffLens Interview Analysis",
-                    }
-
-                    async with session.post(
-                        "https://openrouter.ai/api/v1/chat/completions",
-                        json=payload,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=60),
-                    ) as response:
-                        if response.status == 520 or response.status >= 500:
-                            error_text = await response.text()
-                            logger.warning(f"OpenRouter error {response.status} (attempt {attempt + 1}/{max_retries}): {error_text[:200]}")
-                            if attempt < max_retries - 1:
-                                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                                continue
-                            return None
-                        
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"OpenRouter API error {response.status}: {error_text}")
-                            return None
-
-                        data = await response.json()
-                        
-                        # Extract response content
-                        response_text = data["choices"][0]["message"]["content"]
-                        
-                        # Parse JSON from response
-                        try:
-                            # Handle potential markdown code blocks
-                            if "```json" in response_text:
-                                json_str = response_text.split("```json")[1].split("```")[0]
-                            elif "```" in response_text:
-                                json_str = response_text.split("```")[1].split("```")[0]
-                            else:
-                                json_str = response_text
-
-                            # Try to find JSON object boundaries if parsing fails
-                            json_str = json_str.strip()
-                            
-                            # Find the JSON object
-                            start_idx = json_str.find('{')
-                            if start_idx != -1:
-                                # Find matching closing brace
-                                depth = 0
-                                end_idx = start_idx
-                                for i, char in enumerate(json_str[start_idx:], start_idx):
-                                    if char == '{':
-                                        depth += 1
-                                    elif char == '}':
-                                        depth -= 1
-                                        if depth == 0:
-                                            end_idx = i
-                                            break
-                                json_str = json_str[start_idx:end_idx + 1]
-
-                            result = json.loads(json_str)
-                            return self._normalize_result(result)
-
-                        except json.JSONDecodeError as e:
-                            logger.error(f"Failed to parse OpenRouter response as JSON: {e}")
-                            logger.error(f"Response length: {len(response_text)}, truncated: {response_text[:500]}...")
-                            # Retry on JSON error
-                            if attempt < max_retries - 1:
-                                logger.warning(f"Retrying due to JSON parse error (attempt {attempt + 1}/{max_retries})")
-                                await asyncio.sleep(2 ** attempt)
-                                continue
-                            return None
-
-            except aiohttp.ClientError as e:
+                payload = {
+                    "model": self.openrouter_model,
+                    "messages": [
+                        {
+                            # Static instructions first, marked cacheable so
+                            # retries and re-analyses only prefill the transcript
+                            "role": "system",
+                            "content": [
+                                {
+                                    "type": "text",
+                                    "text": ANALYSIS_PROMPT,
+                                    "cache_control": {"type": "ephemeral"},
+                                }
+                            ],
+                        },
+                        {
+                            "role": "user",
+                            "content": TRANSCRIPT_MESSAGE.format(transcript=transcript),
+                        },
+                    ],
+                    "temperature": 0.3,  # Lower for more consistent analysis
+                    "usage": {"include": True},  # Reports cached prompt tokens
+                }
+
+                headers = {
+                    "Authorization": f"Bearer {self.openrouter_key}",
+                    "Content-Type": "application/json",
+                    "HTTP-Referer": os.getenv("APP_URL", "https://stafflens.local"),
+                    "X-Title": "StaffLens Interview Analysis",
+                }
+
+                status, response_text, retry_after = await self._post_openrouter(payload, headers)
+                if status == 429 or status >= 500:
+                    logger.warning(f"OpenRouter error {status} (attempt {attempt + 1}/{max_retries}): {response_text[:200]}")
+                    if attempt < max_retries - 1:
+                        # Jittered backoff, or whatever the provider asked for
+                        await asyncio.sleep(backoff_delay(attempt, retry_after, ANALYSIS_MAX_RETRY_DELAY))
+                        continue
+                    return None
+
+                if status != 200:
+                    logger.error(f"OpenRouter API error {status}: {response_text}")
+                    return None
+
+                # Parse JSON from response
+                try:
+                    # Parsed in a worker thread so a large completion
+                    # doesn't stall the gateway and voice traffic
+                    result = await asyncio.to_thread(_extract_json, response_text)
+                    return self._normalize_result(result)
+
+                except fastjson.JSONDecodeError as e:
+                    logger.error(f"Failed to parse OpenRouter response as JSON: {e}")
+                    logger.error(f"Response length: {len(response_text)}, truncated: {response_text[:500]}...")
+                    # Retry on JSON error
+                    if attempt < max_retries - 1:
+                        logger.warning(f"Retrying due to JSON parse error (attempt {attempt + 1}/{max_retries})")
+                        await asyncio.sleep(backoff_delay(attempt, max_delay=ANALYSIS_MAX_RETRY_DELAY))
+                        continue
+                    return None
+
+            except HTTP_ERRORS as e:
                 logger.warning(f"OpenRouter connection error (attempt {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(backoff_delay(attempt, max_delay=ANALYSIS_MAX_RETRY_DELAY))
                     continue
                 return None
             except Exception as e:
@@ -308,18 +558,8 @@ class AnalysisService:
         Returns:
             Normalized result dict
         """
-        # Map recommendation to boolean for backward compatibility
-        recommendation_map = {
-            "STRONG_HIRE": True,
-            "HIRE": True,
-            "LEAN_HIRE": True,
-            "LEAN_NO": False,
-            "NO_HIRE": False,
-            "STRONG_NO": False,
-        }
-        
         raw_recommendation = data.get("recommendation", "LEAN_NO")
-        recommended = recommendation_map.get(raw_recommendation, False)
+        recommended = RECOMMENDATION_MAP.get(raw_recommendation, False)
 
         # Ensure all expected fields exist
         normalized = {
@@ -357,7 +597,3 @@ class AnalysisService:
                 normalized["fit_score"] = int(avg * 10)  # Convert 1-10 to 1-100
 
         return normalized
-
-
-# Import asyncio for timeout handling
-import asyncio
@@ -6,18 +6,240 @@ interview data.
 """
 
 import os
-import json
+import asyncio
 import logging
+import sqlite3
 import aiosqlite
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from src.utils import cache, fastjson
+from src.utils.cache import async_ttl_cache
+
 logger = logging.getLogger("stafflens.database")
 
 # Default database path
 DEFAULT_DB_PATH = "data/stafflens.db"
 
+# SQLite 3.45+ stores the JSON columns as binary JSONB (no text parse on
+# read); older builds keep plain JSON text. json() reads back either form.
+JSONB_SUPPORTED = sqlite3.sqlite_version_info >= (3, 45, 0)
+# PRAGMA user_version marking a file that may hold JSONB - older SQLite
+# builds can't decode those blobs, so they refuse to open it
+JSONB_USER_VERSION = 1
+JSON_COLUMNS = frozenset({
+    "scores", "strengths", "concerns", "red_flags", "evidence_quotes", "raw_response",
+})
+_JSON_PARAM = "jsonb(?)" if JSONB_SUPPORTED else "?"
+
+# All statements are fixed module constants, run on the persistent connection
+# so sqlite3's per-connection statement cache keeps them prepared between calls
+RECENT_INTERVIEWS_SQL = """
+    SELECT i.*, ar.fit_score, ar.recommended
+    FROM interviews i
+    LEFT JOIN analysis_results ar ON i.id = ar.interview_id
+    WHERE i.guild_id = ?
+    ORDER BY i.created_at DESC
+    LIMIT ?
+"""
+
+# Total, average fit score and recommended count in one scan. DISTINCT keeps
+# re-analyzed interviews from being counted once per analysis.
+STATS_SQL = """
+    SELECT COUNT(DISTINCT i.id) AS total,
+           AVG(ar.fit_score) AS avg_score,
+           SUM(CASE WHEN ar.recommended = 1 THEN 1 ELSE 0 END) AS recommended
+    FROM interviews i
+    LEFT JOIN analysis_results ar ON ar.interview_id = i.id
+    WHERE i.guild_id = ?
+"""
+
+INSERT_INTERVIEW_SQL = """
+    INSERT INTO interviews
+    (applicant_id, applicant_name, guild_id, channel_name, transcript, started_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_ANALYSIS_SQL = f"""
+    INSERT INTO analysis_results
+    (interview_id, fit_score, recommended, scores, strengths,
+     concerns, red_flags, evidence_quotes, summary, raw_response)
+    VALUES (?, ?, ?, {_JSON_PARAM}, {_JSON_PARAM},
+            {_JSON_PARAM}, {_JSON_PARAM}, {_JSON_PARAM}, ?, {_JSON_PARAM})
+"""
+
+APPLICANT_INTERVIEWS_SQL = """
+    SELECT i.*, ar.fit_score, ar.recommended
+    FROM interviews i
+    LEFT JOIN analysis_results ar ON i.id = ar.interview_id
+    WHERE i.applicant_id = ?
+    ORDER BY i.created_at DESC
+"""
+
+APPLICANT_GUILD_INTERVIEWS_SQL = """
+    SELECT i.*, ar.fit_score, ar.recommended
+    FROM interviews i
+    LEFT JOIN analysis_results ar ON i.id = ar.interview_id
+    WHERE i.applicant_id = ? AND i.guild_id = ?
+    ORDER BY i.created_at DESC
+"""
+
+DELETE_INTERVIEW_SQL = "DELETE FROM interviews WHERE id = ?"
+
+# Older databases created analysis_results without ON DELETE CASCADE;
+# SQLite can't alter a foreign key, so the table is rebuilt once
+CASCADE_MIGRATION_SQL = """
+    PRAGMA foreign_keys=OFF;
+    BEGIN;
+    CREATE TABLE analysis_results_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        interview_id INTEGER NOT NULL,
+        fit_score INTEGER,
+        recommended BOOLEAN,
+        scores JSON,
+        strengths JSON,
+        concerns JSON,
+        red_flags JSON,
+        evidence_quotes JSON,
+        summary TEXT,
+        raw_response JSON,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (interview_id) REFERENCES interviews(id) ON DELETE CASCADE
+    );
+    INSERT INTO analysis_results_new SELECT * FROM analysis_results;
+    DROP TABLE analysis_results;
+    ALTER TABLE analysis_results_new RENAME TO analysis_results;
+    CREATE INDEX IF NOT EXISTS idx_analysis_interview
+        ON analysis_results(interview_id);
+    COMMIT;
+    PRAGMA foreign_keys=ON;
+"""
+
+# analysis_results columns, selected with an "a_" prefix alongside the
+# interview so one JOIN returns both
+ANALYSIS_COLUMNS = (
+    "id", "interview_id", "fit_score", "recommended", "scores", "strengths",
+    "concerns", "red_flags", "evidence_quotes", "summary", "raw_response", "created_at",
+)
+ANALYSIS_SELECT = ", ".join(
+    f"json(ar.{col}) AS a_{col}" if JSONB_SUPPORTED and col in JSON_COLUMNS
+    else f"ar.{col} AS a_{col}"
+    for col in ANALYSIS_COLUMNS
+)
+
+# How long the interview loader waits to coalesce lookups (seconds)
+LOADER_BATCH_DELAY = 0.005
+
+
+def _to_json(value) -> str:
+    """Serialize a value to a JSON string for a TEXT column."""
+    return fastjson.dumps(value).decode("utf-8")
+
+
+def _analysis_params(interview_id: int, analysis: dict) -> tuple:
+    """Build the INSERT_ANALYSIS_SQL parameters for an analysis dict."""
+    # Serialize each field once; raw_response is stitched together from the
+    # same pieces rather than dumping the nested structures a second time
+    encoded = {key: _to_json(value) for key, value in analysis.items()}
+    raw_response = "{" + ",".join(
+        f"{_to_json(key)}:{value}" for key, value in encoded.items()
+    ) + "}"
+    return (
+        interview_id,
+        analysis.get("fit_score"),
+        analysis.get("recommended", False),
+        encoded.get("scores", "{}"),
+        encoded.get("strengths", "[]"),
+        encoded.get("concerns", "[]"),
+        encoded.get("red_flags", "[]"),
+        encoded.get("evidence_quotes", "{}"),
+        analysis.get("summary"),
+        raw_response,
+    )
+
+
+class BatchedInterviewLoader:
+    """
+    Coalesces concurrent interview lookups into a single query.
+    
+    Lookups issued within a short window share one
+    `fetch_interviews` round trip instead of one query each.
+    """
+
+    def __init__(self, db: "Database", delay: float = LOADER_BATCH_DELAY):
+        self.db = db
+        self.delay = delay
+        self.pending: dict[int, list[asyncio.Future]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop only holds weak references to tasks - keep the in-flight
+        # batches alive until they finish
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, interview_id: int) -> Optional[dict]:
+        """
+        Get an interview, batched with any other lookups in flight.
+        
+        Args:
+            interview_id: Interview ID
+            
+        Returns:
+            Interview dict with analysis or None
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.setdefault(interview_id, []).append(future)
+
+        if self._timer is None:
+            self._timer = loop.call_later(self.delay, self._dispatch)
+
+        return await future
+
+    def _dispatch(self):
+        """Flush the pending batch (timer callback)."""
+        batch, self.pending = self.pending, {}
+        self._timer = None
+        task = asyncio.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self):
+        """Cancel queued and in-flight lookups (their callers see CancelledError)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self.pending = self.pending, {}
+        for futures in batch.values():
+            for future in futures:
+                future.cancel()
+
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _resolve(self, batch: dict[int, list[asyncio.Future]]):
+        """Run the batched query and resolve every waiting future."""
+        try:
+            interviews = await self.db.fetch_interviews(list(batch))
+        except asyncio.CancelledError:
+            for futures in batch.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as e:
+            logger.error(f"Batched interview lookup failed: {e}")
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for interview_id, futures in batch.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(interviews.get(interview_id))
+
 
 class Database:
     """
@@ -29,6 +251,11 @@ class Database:
     def __init__(self, db_path: str = None):
         self.db_path = db_path or os.getenv("DATABASE_PATH", DEFAULT_DB_PATH)
         self._connection: Optional[aiosqlite.Connection] = None
+        self.loader = BatchedInterviewLoader(self)
+        self._ready = asyncio.Event()
+        # Every coroutine shares one connection (and so one transaction) -
+        # writers take turns so a rollback can't undo someone else's write
+        self._write_lock = asyncio.Lock()
 
     async def initialize(self):
         """Initialize database and create tables if needed."""
@@ -36,49 +263,130 @@ class Database:
         db_dir = Path(self.db_path).parent
         db_dir.mkdir(parents=True, exist_ok=True)
 
+        db = await self._get_connection()
+        await self._check_json_format(db)
+
         # Create tables
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript("""
-                -- Interviews table
-                CREATE TABLE IF NOT EXISTS interviews (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    applicant_id INTEGER NOT NULL,
-                    applicant_name TEXT NOT NULL,
-                    guild_id INTEGER NOT NULL,
-                    channel_name TEXT,
-                    transcript TEXT,
-                    started_at TIMESTAMP,
-                    ended_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-
-                -- Analysis results table
-                CREATE TABLE IF NOT EXISTS analysis_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    interview_id INTEGER NOT NULL,
-                    fit_score INTEGER,
-                    recommended BOOLEAN,
-                    scores JSON,
-                    strengths JSON,
-                    concerns JSON,
-                    red_flags JSON,
-                    evidence_quotes JSON,
-                    summary TEXT,
-                    raw_response JSON,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (interview_id) REFERENCES interviews(id)
-                );
-
-                -- Create indexes for common queries
-                CREATE INDEX IF NOT EXISTS idx_interviews_guild 
-                    ON interviews(guild_id);
-                CREATE INDEX IF NOT EXISTS idx_interviews_applicant 
-                    ON interviews(applicant_id);
-                CREATE INDEX IF NOT EXISTS idx_analysis_interview 
-                    ON analysis_results(interview_id);
-            """)
-            await db.commit()
-            logger.info(f"Database initialized at {self.db_path}")
+        await db.executescript("""
+            -- Interviews table
+            CREATE TABLE IF NOT EXISTS interviews (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                applicant_id INTEGER NOT NULL,
+                applicant_name TEXT NOT NULL,
+                guild_id INTEGER NOT NULL,
+                channel_name TEXT,
+                transcript TEXT,
+                started_at TIMESTAMP,
+                ended_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- Analysis results table
+            CREATE TABLE IF NOT EXISTS analysis_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                interview_id INTEGER NOT NULL,
+                fit_score INTEGER,
+                recommended BOOLEAN,
+                scores JSON,
+                strengths JSON,
+                concerns JSON,
+                red_flags JSON,
+                evidence_quotes JSON,
+                summary TEXT,
+                raw_response JSON,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (interview_id) REFERENCES interviews(id) ON DELETE CASCADE
+            );
+
+            -- Create indexes for common queries (walked in created_at order,
+            -- so recent-first listings stop at LIMIT without sorting)
+            CREATE INDEX IF NOT EXISTS idx_interviews_guild_created
+                ON interviews(guild_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_interviews_applicant_created
+                ON interviews(applicant_id, guild_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_analysis_interview 
+                ON analysis_results(interview_id);
+
+            -- Superseded by the composite indexes above
+            DROP INDEX IF EXISTS idx_interviews_guild;
+            DROP INDEX IF EXISTS idx_interviews_applicant;
+        """)
+        await db.commit()
+        await self._migrate_cascade(db)
+        logger.info(f"Database initialized at {self.db_path}")
+
+        self._ready.set()
+
+    async def _check_json_format(self, db: aiosqlite.Connection):
+        """
+        Make sure this SQLite build can read the file's JSON columns.
+
+        Raises:
+            RuntimeError: If the file holds JSONB and SQLite is older than 3.45
+        """
+        cursor = await db.execute("PRAGMA user_version")
+        (user_version,) = await cursor.fetchone()
+
+        if JSONB_SUPPORTED:
+            if user_version < JSONB_USER_VERSION:
+                # From here on rows are written as JSONB - mark the file
+                await db.execute(f"PRAGMA user_version = {JSONB_USER_VERSION}")
+                await db.commit()
+        elif user_version >= JSONB_USER_VERSION:
+            raise RuntimeError(
+                f"{self.db_path} stores analysis data as JSONB, which needs SQLite 3.45+ "
+                f"(this Python has {sqlite3.sqlite_version})"
+            )
+
+    async def _migrate_cascade(self, db: aiosqlite.Connection):
+        """Rebuild analysis_results from older databases with ON DELETE CASCADE."""
+        cursor = await db.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'analysis_results'"
+        )
+        row = await cursor.fetchone()
+        if row is None or "ON DELETE CASCADE" in row[0]:
+            return
+
+        logger.info("Migrating analysis_results to ON DELETE CASCADE")
+        await db.executescript(CASCADE_MIGRATION_SQL)
+
+    async def wait_ready(self):
+        """Wait until initialize() has finished creating the schema."""
+        await self._ready.wait()
+
+    async def _get_connection(self) -> aiosqlite.Connection:
+        """Get the long-lived connection, opening it on first use."""
+        if self._connection is None:
+            db = await aiosqlite.connect(self.db_path)
+            db.row_factory = aiosqlite.Row
+            # WAL lets reads proceed during writes; NORMAL sync is safe under WAL
+            await db.execute("PRAGMA journal_mode=WAL")
+            await db.execute("PRAGMA synchronous=NORMAL")
+            await db.execute("PRAGMA temp_store=MEMORY")
+            await db.execute("PRAGMA cache_size=-20000")
+            # Deleting an interview cascades to its analysis
+            await db.execute("PRAGMA foreign_keys=ON")
+            self._connection = db
+        return self._connection
+
+    async def _write(self, sql: str, params: tuple) -> aiosqlite.Cursor:
+        """Run one write statement in its own transaction, serialized with other writers."""
+        db = await self._get_connection()
+        async with self._write_lock:
+            try:
+                cursor = await db.execute(sql, params)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+        return cursor
+
+    async def close(self):
+        """Cancel pending lookups and close the long-lived connection."""
+        await self.loader.close()
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
 
     async def save_transcript(
         self,
@@ -103,27 +411,15 @@ class Database:
         Returns:
             Interview ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO interviews 
-                (applicant_id, applicant_name, guild_id, channel_name, transcript, started_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    applicant_id,
-                    applicant_name,
-                    guild_id,
-                    channel_name,
-                    transcript,
-                    started_at.isoformat(),
-                ),
-            )
-            await db.commit()
-            
-            interview_id = cursor.lastrowid
-            logger.info(f"Saved transcript for interview #{interview_id}")
-            return interview_id
+        cursor = await self._write(
+            INSERT_INTERVIEW_SQL,
+            (applicant_id, applicant_name, guild_id, channel_name, transcript, started_at.isoformat()),
+        )
+
+        interview_id = cursor.lastrowid
+        cache.invalidate(guild_id)
+        logger.info(f"Saved transcript for interview #{interview_id}")
+        return interview_id
 
     async def save_analysis(self, interview_id: int, analysis: dict) -> int:
         """
@@ -136,32 +432,12 @@ class Database:
         Returns:
             Analysis record ID
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            cursor = await db.execute(
-                """
-                INSERT INTO analysis_results
-                (interview_id, fit_score, recommended, scores, strengths, 
-                 concerns, red_flags, evidence_quotes, summary, raw_response)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    interview_id,
-                    analysis.get("fit_score"),
-                    analysis.get("recommended", False),
-                    json.dumps(analysis.get("scores", {})),
-                    json.dumps(analysis.get("strengths", [])),
-                    json.dumps(analysis.get("concerns", [])),
-                    json.dumps(analysis.get("red_flags", [])),
-                    json.dumps(analysis.get("evidence_quotes", {})),
-                    analysis.get("summary"),
-                    json.dumps(analysis),
-                ),
-            )
-            await db.commit()
-            
-            analysis_id = cursor.lastrowid
-            logger.info(f"Saved analysis #{analysis_id} for interview #{interview_id}")
-            return analysis_id
+        cursor = await self._write(INSERT_ANALYSIS_SQL, _analysis_params(interview_id, analysis))
+
+        analysis_id = cursor.lastrowid
+        cache.invalidate()
+        logger.info(f"Saved analysis #{analysis_id} for interview #{interview_id}")
+        return analysis_id
 
     async def get_interview(self, interview_id: int) -> Optional[dict]:
         """
@@ -173,43 +449,60 @@ class Database:
         Returns:
             Interview dict with analysis or None
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            # Get interview
-            cursor = await db.execute(
-                "SELECT * FROM interviews WHERE id = ?",
-                (interview_id,),
-            )
-            row = await cursor.fetchone()
-            
-            if not row:
-                return None
+        interviews = await self.fetch_interviews([interview_id])
+        return interviews.get(interview_id)
 
-            interview = dict(row)
-            
-            # Get analysis
-            cursor = await db.execute(
-                "SELECT * FROM analysis_results WHERE interview_id = ?",
-                (interview_id,),
-            )
-            analysis_row = await cursor.fetchone()
+    async def fetch_interviews(self, ids: list[int]) -> dict[int, dict]:
+        """
+        Get several interviews with their analysis in one round trip.
+        
+        Args:
+            ids: Interview IDs
             
-            if analysis_row:
-                analysis = dict(analysis_row)
-                # Parse JSON fields
-                for field in ["scores", "strengths", "concerns", "red_flags", "evidence_quotes"]:
-                    if analysis.get(field):
-                        try:
-                            analysis[field] = json.loads(analysis[field])
-                        except json.JSONDecodeError:
-                            pass
-                interview["analysis"] = analysis
-                interview["fit_score"] = analysis.get("fit_score")
-                interview["recommended"] = analysis.get("recommended")
-
-            return interview
+        Returns:
+            Dict of interview ID -> interview dict (missing IDs are omitted)
+        """
+        if not ids:
+            return {}
+
+        placeholders = ", ".join("?" for _ in ids)
+
+        db = await self._get_connection()
+
+        # Interviews and their analysis in one query (oldest analysis first)
+        cursor = await db.execute(
+            f"""
+            SELECT i.*, {ANALYSIS_SELECT}
+            FROM interviews i
+            LEFT JOIN analysis_results ar ON ar.interview_id = i.id
+            WHERE i.id IN ({placeholders})
+            ORDER BY ar.id
+            """,
+            tuple(ids),
+        )
+
+        interviews: dict[int, dict] = {}
+        for row in await cursor.fetchall():
+            row = dict(row)
+            analysis = {col: row.pop(f"a_{col}") for col in ANALYSIS_COLUMNS}
+            interview = interviews.setdefault(row["id"], row)
+            if analysis["id"] is None or "analysis" in interview:
+                continue
+
+            # Parse JSON fields
+            for field in ["scores", "strengths", "concerns", "red_flags", "evidence_quotes"]:
+                if analysis.get(field):
+                    try:
+                        analysis[field] = fastjson.loads(analysis[field])
+                    except fastjson.JSONDecodeError:
+                        pass
+            interview["analysis"] = analysis
+            interview["fit_score"] = analysis.get("fit_score")
+            interview["recommended"] = analysis.get("recommended")
 
+        return interviews
+
+    @async_ttl_cache(30)
     async def get_recent_interviews(
         self,
         guild_id: int,
@@ -225,23 +518,10 @@ class Database:
         Returns:
             List of interview dicts
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            cursor = await db.execute(
-                """
-                SELECT i.*, ar.fit_score, ar.recommended
-                FROM interviews i
-                LEFT JOIN analysis_results ar ON i.id = ar.interview_id
-                WHERE i.guild_id = ?
-                ORDER BY i.created_at DESC
-                LIMIT ?
-                """,
-                (guild_id, limit),
-            )
-            
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        db = await self._get_connection()
+        cursor = await db.execute(RECENT_INTERVIEWS_SQL, (guild_id, limit))
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
 
     async def get_interviews_by_applicant(
         self,
@@ -258,35 +538,17 @@ class Database:
         Returns:
             List of interview dicts
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            db.row_factory = aiosqlite.Row
-            
-            if guild_id:
-                cursor = await db.execute(
-                    """
-                    SELECT i.*, ar.fit_score, ar.recommended
-                    FROM interviews i
-                    LEFT JOIN analysis_results ar ON i.id = ar.interview_id
-                    WHERE i.applicant_id = ? AND i.guild_id = ?
-                    ORDER BY i.created_at DESC
-                    """,
-                    (applicant_id, guild_id),
-                )
-            else:
-                cursor = await db.execute(
-                    """
-                    SELECT i.*, ar.fit_score, ar.recommended
-                    FROM interviews i
-                    LEFT JOIN analysis_results ar ON i.id = ar.interview_id
-                    WHERE i.applicant_id = ?
-                    ORDER BY i.created_at DESC
-                    """,
-                    (applicant_id,),
-                )
-            
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
+        db = await self._get_connection()
+
+        if guild_id:
+            cursor = await db.execute(APPLICANT_GUILD_INTERVIEWS_SQL, (applicant_id, guild_id))
+        else:
+            cursor = await db.execute(APPLICANT_INTERVIEWS_SQL, (applicant_id,))
 
+        rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    @async_ttl_cache(30)
     async def get_stats(self, guild_id: int) -> dict:
         """
         Get interview statistics for a guild.
@@ -297,44 +559,18 @@ class Database:
         Returns:
             Stats dict
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Total interviews
-            cursor = await db.execute(
-                "SELECT COUNT(*) FROM interviews WHERE guild_id = ?",
-                (guild_id,),
-            )
-            total = (await cursor.fetchone())[0]
-
-            # Average fit score
-            cursor = await db.execute(
-                """
-                SELECT AVG(ar.fit_score)
-                FROM interviews i
-                JOIN analysis_results ar ON i.id = ar.interview_id
-                WHERE i.guild_id = ?
-                """,
-                (guild_id,),
-            )
-            avg_score = (await cursor.fetchone())[0] or 0
-
-            # Recommended count
-            cursor = await db.execute(
-                """
-                SELECT COUNT(*)
-                FROM interviews i
-                JOIN analysis_results ar ON i.id = ar.interview_id
-                WHERE i.guild_id = ? AND ar.recommended = 1
-                """,
-                (guild_id,),
-            )
-            recommended = (await cursor.fetchone())[0]
+        db = await self._get_connection()
+        cursor = await db.execute(STATS_SQL, (guild_id,))
+        total, avg_score, recommended = await cursor.fetchone()
+        avg_score = avg_score or 0
+        recommended = recommended or 0
 
-            return {
-                "total_interviews": total,
-                "avg_fit_score": avg_score,
-                "recommended_count": recommended,
-                "recommendation_rate": (recommended / total * 100) if total > 0 else 0,
-            }
+        return {
+            "total_interviews": total,
+            "avg_fit_score": avg_score,
+            "recommended_count": recommended,
+            "recommendation_rate": (recommended / total * 100) if total > 0 else 0,
+        }
 
     async def delete_interview(self, interview_id: int) -> bool:
         """
@@ -346,21 +582,11 @@ class Database:
         Returns:
             True if deleted
         """
-        async with aiosqlite.connect(self.db_path) as db:
-            # Delete analysis first (foreign key)
-            await db.execute(
-                "DELETE FROM analysis_results WHERE interview_id = ?",
-                (interview_id,),
-            )
-            
-            # Delete interview
-            cursor = await db.execute(
-                "DELETE FROM interviews WHERE id = ?",
-                (interview_id,),
-            )
-            await db.commit()
-            
-            deleted = cursor.rowcount > 0
-            if deleted:
-                logger.info(f"Deleted interview #{interview_id}")
-            return deleted
+        # Analysis rows go with it via ON DELETE CASCADE
+        cursor = await self._write(DELETE_INTERVIEW_SQL, (interview_id,))
+
+        deleted = cursor.rowcount > 0
+        if deleted:
+            cache.invalidate()
+            logger.info(f"Deleted interview #{interview_id}")
+        return deleted
@@ -4,13 +4,32 @@ Transcription Service - Deepgram integration for audio transcription.
 Uses Deepgram's REST API directly for audio transcription (no SDK dependency issues).
 """
 
+import asyncio
 import logging
 import os
+import shutil
 import aiohttp
-from typing import Optional
+from types import MappingProxyType
+from typing import Optional, Union
+
+from src.utils import fastjson
 
 logger = logging.getLogger("stafflens.transcription")
 
+# Utterances larger than this are Opus-encoded before upload (~10x smaller)
+OPUS_MIN_BYTES = 1_000_000
+OPUS_BITRATE = "24k"
+
+# Query parameters sent with every request
+DEFAULT_PARAMS = MappingProxyType({
+    "model": "nova-2",
+    "language": "en",
+    "smart_format": "true",
+    "diarize": "true",
+    "punctuate": "true",
+    "utterances": "true",
+})
+
 
 class TranscriptionService:
     """
@@ -25,15 +44,119 @@ class TranscriptionService:
             logger.warning("DEEPGRAM_API_KEY not set - transcription will fail!")
         
         self.base_url = "https://api.deepgram.com/v1/listen"
+        self._auth = f"Token {self.api_key}" if self.api_key else None
+
+        # Shared HTTP session (created lazily on the bot's event loop)
+        self._session: Optional[aiohttp.ClientSession] = None
         logger.info("TranscriptionService initialized")
 
-    async def transcribe_audio(self, audio_data: bytes, mimetype: str = "audio/wav") -> Optional[dict]:
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                ),
+                timeout=aiohttp.ClientTimeout(total=120),
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def transcribe_pcm(
+        self,
+        pcm: Union[bytes, memoryview],
+        sample_rate: int = 48000,
+        channels: int = 2,
+    ) -> Optional[dict]:
+        """
+        Transcribe raw 16-bit little-endian PCM (no WAV header needed).
+        
+        Args:
+            pcm: PCM samples
+            sample_rate: Samples per second
+            channels: Interleaved channel count
+            
+        Returns:
+            Dictionary with transcript and segments, or None on error
+        """
+        if len(pcm) > OPUS_MIN_BYTES:
+            ogg = await self._encode_opus(pcm, sample_rate, channels)
+            if ogg:
+                return await self.transcribe_audio(ogg, mimetype="audio/ogg")
+
+        return await self.transcribe_audio(
+            pcm,
+            mimetype="audio/raw",
+            extra_params={
+                "encoding": "linear16",
+                "sample_rate": str(sample_rate),
+                "channels": str(channels),
+            },
+        )
+
+    async def _encode_opus(
+        self,
+        pcm: Union[bytes, memoryview],
+        sample_rate: int,
+        channels: int,
+    ) -> Optional[bytes]:
+        """
+        Encode PCM to Ogg/Opus with FFmpeg to cut upload size.
+        
+        Args:
+            pcm: 16-bit little-endian PCM samples
+            sample_rate: Samples per second
+            channels: Interleaved channel count
+            
+        Returns:
+            Ogg/Opus bytes, or None if FFmpeg is unavailable or fails
+            (the caller then uploads the raw PCM)
+        """
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            return None
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                ffmpeg, "-hide_banner", "-loglevel", "error",
+                "-f", "s16le", "-ar", str(sample_rate), "-ac", str(channels), "-i", "pipe:0",
+                "-c:a", "libopus", "-b:a", OPUS_BITRATE, "-f", "ogg", "pipe:1",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            ogg, error = await process.communicate(pcm)
+        except Exception as e:
+            logger.warning("Opus encoding failed, sending raw PCM: %s", e)
+            return None
+        
+        if process.returncode != 0 or not ogg:
+            logger.warning("Opus encoding failed, sending raw PCM: %.200s", error.decode(errors="replace"))
+            return None
+        
+        logger.debug("Encoded %d bytes of PCM to %d bytes of Opus", len(pcm), len(ogg))
+        return ogg
+
+    async def transcribe_audio(
+        self,
+        audio_data: Union[bytes, memoryview],
+        mimetype: str = "audio/wav",
+        extra_params: Optional[dict] = None,
+    ) -> Optional[dict]:
         """
         Transcribe audio data using Deepgram's REST API.
         
         Args:
             audio_data: Raw audio bytes
             mimetype: Audio MIME type (default: audio/wav)
+            extra_params: Additional Deepgram query parameters
             
         Returns:
             Dictionary with transcript and segments, or None on error
@@ -48,38 +171,30 @@ class TranscriptionService:
         
         try:
             headers = {
-                "Authorization": f"Token {self.api_key}",
+                "Authorization": self._auth,
                 "Content-Type": mimetype,
             }
+            params = {**DEFAULT_PARAMS, **extra_params} if extra_params else DEFAULT_PARAMS
             
-            params = {
-                "model": "nova-2",
-                "language": "en",
-                "smart_format": "true",
-                "diarize": "true",
-                "punctuate": "true",
-                "utterances": "true",
-            }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.base_url,
-                    headers=headers,
-                    params=params,
-                    data=audio_data,
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Deepgram API error {response.status}: {error_text}")
-                        return None
-                    
-                    result = await response.json()
+            session = await self._get_session()
+            async with session.post(
+                self.base_url,
+                headers=headers,
+                params=params,
+                data=audio_data,
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error("Deepgram API error %s: %s", response.status, error_text)
+                    return None
+                
+                result = fastjson.loads(await response.read())
             
             # Parse the response
             return self._parse_response(result)
             
         except Exception as e:
-            logger.error(f"Transcription error: {e}")
+            logger.error("Transcription error: %s", e)
             return None
 
     def _parse_response(self, result: dict) -> Optional[dict]:
@@ -88,8 +203,10 @@ class TranscriptionService:
             parsed = {
                 "transcript": "",
                 "segments": [],
-                "speakers": set(),
+                "speakers": [],
             }
+            # Deduplicated in first-seen order (a dict, so no set -> list shuffle)
+            speakers_seen: dict[str, None] = {}
             
             if "results" not in result:
                 return None
@@ -98,17 +215,22 @@ class TranscriptionService:
             
             # Try to get utterances (speaker-labeled segments)
             if "utterances" in results and results["utterances"]:
+                lines: list[str] = []
+                segments = parsed["segments"]
                 for utterance in results["utterances"]:
-                    speaker = f"Speaker {utterance.get('speaker', 0)}"
-                    parsed["speakers"].add(speaker)
-                    parsed["segments"].append({
+                    get = utterance.get
+                    speaker = f"Speaker {get('speaker', 0)}"
+                    text = get("transcript", "")
+                    speakers_seen.setdefault(speaker, None)
+                    segments.append({
                         "speaker": speaker,
-                        "text": utterance.get("transcript", ""),
-                        "start": utterance.get("start", 0),
-                        "end": utterance.get("end", 0),
-                        "confidence": utterance.get("confidence", 0),
+                        "text": text,
+                        "start": get("start", 0),
+                        "end": get("end", 0),
+                        "confidence": get("confidence", 0),
                     })
-                    parsed["transcript"] += f"[{speaker}]: {utterance.get('transcript', '')}\n"
+                    lines.append(f"[{speaker}]: {text}")
+                parsed["transcript"] = "\n".join(lines) + "\n"
             
             # Fallback to simple transcript without speaker labels
             elif "channels" in results and results["channels"]:
@@ -116,12 +238,16 @@ class TranscriptionService:
                 if "alternatives" in channel and channel["alternatives"]:
                     parsed["transcript"] = channel["alternatives"][0].get("transcript", "")
             
-            # Convert speakers set to list for JSON serialization
-            parsed["speakers"] = list(parsed["speakers"])
+            parsed["speakers"] = list(speakers_seen)
+            
+            # Silence - nothing worth passing on
+            if not parsed["transcript"].strip() and not parsed["segments"]:
+                logger.warning("Deepgram returned empty transcript")
+                return None
             
-            logger.info(f"Transcription successful: {len(parsed['transcript'])} chars")
+            logger.info("Transcription successful: %d chars", len(parsed["transcript"]))
             return parsed
             
         except Exception as e:
-            logger.error(f"Error parsing Deepgram response: {e}")
+            logger.error("Error parsing Deepgram response: %s", e)
             return None
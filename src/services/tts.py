@@ -4,13 +4,25 @@ Text-to-Speech Service - Generate spoken audio for the interview bot.
 Uses edge-tts for high-quality, free text-to-speech.
 """
 
+import hashlib
 import logging
-import io
 import asyncio
-from typing import Optional
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Optional
 
 logger = logging.getLogger("stafflens.tts")
 
+# Synthesized clips kept in memory (~50KB each, so ~12MB at most)
+AUDIO_CACHE_SIZE = 256
+
+# Pre-warmed static lines persisted across restarts, one MP3 per (voice, text)
+DISK_CACHE_DIR = Path(".cache/tts")
+
+# Concurrent Edge TTS requests while pre-warming
+PREWARM_CONCURRENCY = 4
+
 # Try to import edge_tts, fall back gracefully
 try:
     import edge_tts
@@ -44,18 +56,26 @@ class TTSService:
         """
         self.voice = self.VOICES.get(voice, self.VOICES["female_us"])
         self.available = EDGE_TTS_AVAILABLE
+
+        # {(voice, text): MP3 bytes}, least recently used first
+        self._cache: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        # Pre-warmed static lines, kept out of the LRU so dynamic replies
+        # can't evict them: {(voice, text): MP3 bytes}
+        self._pinned: dict[tuple[str, str], bytes] = {}
         
         if self.available:
-            logger.info(f"TTS initialized with voice: {self.voice}")
+            logger.info("TTS initialized with voice: %s", self.voice)
         else:
             logger.warning("TTS service unavailable - edge-tts not installed")
     
-    async def synthesize(self, text: str) -> Optional[bytes]:
+    async def synthesize(self, text: str, persist: bool = False) -> Optional[bytes]:
         """
         Convert text to speech audio.
         
         Args:
             text: The text to speak
+            persist: Also use the on-disk cache. Only for static lines -
+                dynamic replies carry applicant details and stay in memory
             
         Returns:
             MP3 audio bytes, or None if TTS unavailable
@@ -63,23 +83,105 @@ class TTSService:
         if not self.available:
             logger.warning("TTS not available, skipping synthesis")
             return None
+
+        # Scripted lines repeat across interviews - replay the earlier audio
+        key = (self.voice, text)
+        cached = self._pinned.get(key)
+        if cached is not None:
+            return cached
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        path = self._disk_path(text) if persist else None
+        if path:
+            cached = await asyncio.to_thread(self._read_disk, path)
+            if cached:
+                self._remember(key, cached)
+                return cached
         
         try:
             communicate = edge_tts.Communicate(text, self.voice)
             
-            audio_data = io.BytesIO()
+            buf = bytearray()
             async for chunk in communicate.stream():
                 if chunk["type"] == "audio":
-                    audio_data.write(chunk["data"])
+                    buf.extend(chunk["data"])
             
-            audio_bytes = audio_data.getvalue()
-            logger.debug(f"Synthesized {len(audio_bytes)} bytes of audio")
+            audio_bytes = bytes(buf)
+            logger.debug("Synthesized %d bytes of audio", len(audio_bytes))
+            if audio_bytes:
+                self._remember(key, audio_bytes)
+                if path:
+                    await asyncio.to_thread(self._write_disk, path, audio_bytes)
             return audio_bytes
             
         except Exception as e:
-            logger.error(f"TTS synthesis failed: {e}")
+            logger.error("TTS synthesis failed: %s", e)
             return None
     
+    async def prewarm(self, texts: Iterable[str]) -> dict[str, bytes]:
+        """
+        Synthesize a batch of lines ahead of time.
+        
+        Lines already on disk load without a TTS round trip; the rest are
+        synthesized a few at a time and persisted for the next start.
+        Prepared lines stay in memory for the service's lifetime.
+        
+        Args:
+            texts: Lines to prepare (duplicates are skipped)
+            
+        Returns:
+            Mapping of text -> MP3 bytes for every line that succeeded
+        """
+        if not self.available:
+            return {}
+
+        semaphore = asyncio.Semaphore(PREWARM_CONCURRENCY)
+
+        async def prepare(text: str) -> Optional[bytes]:
+            async with semaphore:
+                return await self.synthesize(text, persist=True)
+
+        unique = list(dict.fromkeys(texts))
+        results = await asyncio.gather(*(prepare(text) for text in unique))
+        prepared = {text: audio for text, audio in zip(unique, results) if audio}
+        for text, audio in prepared.items():
+            self._pinned[(self.voice, text)] = audio
+        return prepared
+
+    def _remember(self, key: tuple[str, str], audio: bytes):
+        """Add a clip to the in-memory LRU."""
+        self._cache[key] = audio
+        if len(self._cache) > AUDIO_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _disk_path(self, text: str) -> Path:
+        """On-disk cache location for a line in the current voice."""
+        key = hashlib.sha256(f"{self.voice}|{text}".encode()).digest()[:16].hex()
+        return DISK_CACHE_DIR / f"{key}.mp3"
+
+    @staticmethod
+    def _read_disk(path: Path) -> Optional[bytes]:
+        """Read a cached clip, or None if it isn't there."""
+        try:
+            return path.read_bytes()
+        except OSError:
+            return None
+
+    @staticmethod
+    def _write_disk(path: Path, audio: bytes):
+        """Persist a clip (best effort - the cache is only an optimization)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per write so concurrent writers of one line don't collide
+            tmp = path.with_name(f"{path.stem}.{uuid.uuid4().hex}.tmp")
+            tmp.write_bytes(audio)
+            tmp.replace(path)
+        except OSError as e:
+            logger.debug("Couldn't cache TTS audio to disk: %s", e)
+    
     async def synthesize_to_file(self, text: str, filepath: str) -> bool:
         """
         Convert text to speech and save to file.
@@ -97,19 +199,22 @@ class TTSService:
         try:
             communicate = edge_tts.Communicate(text, self.voice)
             await communicate.save(filepath)
-            logger.debug(f"Saved TTS audio to {filepath}")
+            logger.debug("Saved TTS audio to %s", filepath)
             return True
         except Exception as e:
-            logger.error(f"Failed to save TTS audio: {e}")
+            logger.error("Failed to save TTS audio: %s", e)
             return False
 
 
-# Singleton instance
-_tts_service: Optional[TTSService] = None
+# One instance per resolved voice (bounded by VOICES - unknown presets
+# fall back to the default voice and share its instance)
+_tts_services: dict[str, TTSService] = {}
 
 def get_tts_service(voice: str = "female_us") -> TTSService:
-    """Get or create the TTS service singleton."""
-    global _tts_service
-    if _tts_service is None:
-        _tts_service = TTSService(voice)
-    return _tts_service
+    """Get or create the TTS service for a voice preset."""
+    voice_id = TTSService.VOICES.get(voice, TTSService.VOICES["female_us"])
+    service = _tts_services.get(voice_id)
+    if service is None:
+        service = TTSService(voice)
+        _tts_services[voice_id] = service
+    return service
@@ -0,0 +1,70 @@
+"""
+Cache Utilities - Lightweight async TTL caching for slow-changing queries.
+
+Used to avoid repeated database round trips when admins spam
+read-only commands like !history and !status.
+"""
+
+import asyncio
+import functools
+import logging
+import time
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger("stafflens.cache")
+
+# {key: (expiry_monotonic, value)}
+_cache: dict[tuple, tuple[float, Any]] = {}
+_lock = asyncio.Lock()
+
+
+def async_ttl_cache(ttl_seconds: float) -> Callable:
+    """
+    Cache the result of an async function for a fixed time window.
+
+    Args:
+        ttl_seconds: How long a cached result stays valid
+
+    Returns:
+        Decorator for async functions
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__qualname__, *args, *sorted(kwargs.items()))
+            now = time.monotonic()
+
+            async with _lock:
+                entry = _cache.get(key)
+                if entry and entry[0] > now:
+                    return entry[1]
+
+            value = await func(*args, **kwargs)
+
+            async with _lock:
+                _cache[key] = (time.monotonic() + ttl_seconds, value)
+            return value
+
+        return wrapper
+    return decorator
+
+
+def invalidate(guild_id: Optional[int] = None):
+    """
+    Evict cached results.
+
+    Args:
+        guild_id: Only evict entries for this guild. Clears everything if None.
+    """
+    if guild_id is None:
+        _cache.clear()
+        return
+
+    stale = [
+        key for key in _cache
+        if guild_id in key
+        or any(isinstance(part, tuple) and part[-1] == guild_id for part in key)
+    ]
+    for key in stale:
+        _cache.pop(key, None)
+    logger.debug(f"Invalidated {len(stale)} cached entries for guild {guild_id}")
@@ -5,17 +5,41 @@ Creates beautifully formatted Discord embeds for interview
 reports and other bot messages.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import islice
 from typing import Optional, Any
 
 import discord
 
+_UTC = timezone.utc
+
+# Report status line and embed color per recommendation tier
+_RECOMMENDATION_DISPLAY: dict[str, tuple[str, discord.Color]] = {
+    "STRONG_HIRE": ("🟢 STRONG HIRE", discord.Color.green()),
+    "HIRE": ("✅ HIRE", discord.Color.green()),
+    "LEAN_HIRE": ("🟡 LEAN HIRE", discord.Color.gold()),
+    "LEAN_NO": ("🟠 LEAN NO", discord.Color.orange()),
+    "NO_HIRE": ("❌ NO HIRE", discord.Color.red()),
+    "STRONG_NO": ("🔴 STRONG NO", discord.Color.dark_red()),
+}
+_DEFAULT_RECOMMENDATION = ("⚠️ NEEDS REVIEW", discord.Color.greyple())
+
+# Emoji shown next to each trait score
+_SCORE_EMOJI = {
+    "communication_clarity": "💬",
+    "problem_solving": "🧩",
+    "confidence": "💪",
+    "emotional_regulation": "🧘",
+    "cultural_fit": "🤝",
+}
+
 
 def create_report_embed(
     applicant: Any,
     analysis: dict,
     transcript_preview: str,
     fit_threshold: int = 70,
+    timestamp: Optional[datetime] = None,
 ) -> discord.Embed:
     """
     Create a comprehensive interview report embed.
@@ -25,6 +49,7 @@ def create_report_embed(
         analysis: Analysis result dict
         transcript_preview: First ~500 chars of transcript
         fit_threshold: Score threshold for recommendation
+        timestamp: Embed time (defaults to now; pass one to share it across embeds)
         
     Returns:
         Discord Embed object
@@ -34,125 +59,98 @@ def create_report_embed(
     recommended = analysis.get("recommended", fit_score >= fit_threshold)
 
     # Determine embed color and status based on recommendation tier
-    recommendation_display = {
-        "STRONG_HIRE": ("🟢 STRONG HIRE", discord.Color.green()),
-        "HIRE": ("✅ HIRE", discord.Color.green()),
-        "LEAN_HIRE": ("🟡 LEAN HIRE", discord.Color.gold()),
-        "LEAN_NO": ("🟠 LEAN NO", discord.Color.orange()),
-        "NO_HIRE": ("❌ NO HIRE", discord.Color.red()),
-        "STRONG_NO": ("🔴 STRONG NO", discord.Color.dark_red()),
-    }
-    
-    status_text, color = recommendation_display.get(
-        recommendation, 
-        ("⚠️ NEEDS REVIEW", discord.Color.greyple())
-    )
+    status_text, color = _RECOMMENDATION_DISPLAY.get(recommendation, _DEFAULT_RECOMMENDATION)
 
-    # Create embed
-    embed = discord.Embed(
-        title=f"📋 Interview Report: {applicant.display_name}",
-        description=f"**{status_text}**",
-        color=color,
-        timestamp=datetime.utcnow(),
-    )
+    display_name = applicant.display_name
+    applicant_id = applicant.id
+    avatar = getattr(applicant, "avatar", None)
+    icon_url = avatar.url if avatar else None
 
-    # Set applicant info
-    embed.set_author(
-        name=f"Applicant ID: {applicant.id}",
-        icon_url=applicant.avatar.url if hasattr(applicant, 'avatar') and applicant.avatar else None,
-    )
+    # Fields are collected as plain dicts and the embed is built in one go
+    fields: list[dict] = []
 
     # Fit Score with visual bar
     score_bar = _create_score_bar(fit_score)
-    embed.add_field(
-        name="🎯 Fit Score",
-        value=f"**{fit_score}**/100\n{score_bar}",
-        inline=False,
-    )
+    fields.append({
+        "name": "🎯 Fit Score",
+        "value": f"**{fit_score}**/100\n{score_bar}",
+        "inline": False,
+    })
 
     # Individual trait scores
     scores = analysis.get("scores", {})
     if scores:
         score_lines = []
-        score_emoji = {
-            "communication_clarity": "💬",
-            "problem_solving": "🧩",
-            "confidence": "💪",
-            "emotional_regulation": "🧘",
-            "cultural_fit": "🤝",
-        }
         for trait, score in scores.items():
-            emoji = score_emoji.get(trait, "📊")
+            emoji = _SCORE_EMOJI.get(trait, "📊")
             trait_name = trait.replace("_", " ").title()
             score_lines.append(f"{emoji} **{trait_name}:** {score}/10")
         
-        embed.add_field(
-            name="📊 Trait Scores",
-            value="\n".join(score_lines),
-            inline=True,
-        )
+        fields.append({
+            "name": "📊 Trait Scores",
+            "value": "\n".join(score_lines),
+            "inline": True,
+        })
 
     # Key Strengths
     strengths = analysis.get("strengths", [])
     if strengths:
-        embed.add_field(
-            name="💪 Key Strengths",
-            value="\n".join(f"• {s}" for s in strengths[:5]),
-            inline=True,
-        )
+        fields.append({
+            "name": "💪 Key Strengths",
+            "value": _bullet_join(strengths, 5),
+            "inline": True,
+        })
 
     # Concerns
     concerns = analysis.get("concerns", [])
     if concerns:
-        embed.add_field(
-            name="⚠️ Concerns",
-            value="\n".join(f"• {c}" for c in concerns[:5]),
-            inline=True,
-        )
+        fields.append({
+            "name": "⚠️ Concerns",
+            "value": _bullet_join(concerns, 5),
+            "inline": True,
+        })
 
     # Red Flags (prominent if present)
     red_flags = analysis.get("red_flags", [])
     if red_flags:
-        embed.add_field(
-            name="🚩 Red Flags",
-            value="\n".join(f"• {rf}" for rf in red_flags),
-            inline=False,
-        )
+        fields.append({
+            "name": "🚩 Red Flags",
+            "value": _bullet_join(red_flags),
+            "inline": False,
+        })
 
     # Psychological Profile (new)
     psych_profile = analysis.get("psychological_profile", "")
     if psych_profile:
-        embed.add_field(
-            name="🧠 Psychological Profile",
-            value=psych_profile[:1024],
-            inline=False,
-        )
+        fields.append({
+            "name": "🧠 Psychological Profile",
+            "value": _clip(psych_profile, 1024),
+            "inline": False,
+        })
 
     # Culture Alignment (new)
     culture_align = analysis.get("culture_alignment", "")
     if culture_align:
-        embed.add_field(
-            name="🏠 Culture Alignment",
-            value=culture_align[:1024],
-            inline=False,
-        )
+        fields.append({
+            "name": "🏠 Culture Alignment",
+            "value": _clip(culture_align, 1024),
+            "inline": False,
+        })
 
     # Evidence Quotes
     evidence = analysis.get("evidence_quotes", {})
     if evidence.get("positive"):
-        quotes = evidence["positive"][:2]
-        embed.add_field(
-            name="💬 Positive Quotes",
-            value="\n".join(f'> "{q}"' for q in quotes),
-            inline=False,
-        )
+        fields.append({
+            "name": "💬 Positive Quotes",
+            "value": _quote_join(evidence["positive"], 2),
+            "inline": False,
+        })
     if evidence.get("negative"):
-        quotes = evidence["negative"][:2]
-        embed.add_field(
-            name="💬 Concerning Quotes",
-            value="\n".join(f'> "{q}"' for q in quotes),
-            inline=False,
-        )
+        fields.append({
+            "name": "💬 Concerning Quotes",
+            "value": _quote_join(evidence["negative"], 2),
+            "inline": False,
+        })
 
     # Summary & Recommendation Reasoning
     summary = analysis.get("summary", "")
@@ -161,32 +159,77 @@ def create_report_embed(
         summary_text = summary
         if reasoning:
             summary_text += f"\n\n**Reasoning:** {reasoning}"
-        embed.add_field(
-            name="📝 Summary",
-            value=summary_text[:1024],
-            inline=False,
-        )
+        fields.append({
+            "name": "📝 Summary",
+            "value": _clip(summary_text, 1024),
+            "inline": False,
+        })
 
     # Transcript Preview
     if transcript_preview:
-        preview = transcript_preview[:400]
-        if len(transcript_preview) > 400:
-            preview += "..."
-        embed.add_field(
-            name="📜 Transcript Preview",
-            value=f"```{preview}```",
-            inline=False,
-        )
+        preview = _clip(transcript_preview, 400)
+        fields.append({
+            "name": "📜 Transcript Preview",
+            "value": f"```{preview}```",
+            "inline": False,
+        })
 
-    # Footer
-    embed.set_footer(
-        text=f"StaffLens Analysis • Threshold: {fit_threshold} • Model: Gemini 3 Flash",
-    )
+    # Applicant info
+    author = {"name": f"Applicant ID: {applicant_id}"}
+    if icon_url:
+        author["icon_url"] = icon_url
 
-    return embed
+    return discord.Embed.from_dict({
+        "title": f"📋 Interview Report: {display_name}",
+        "description": f"**{status_text}**",
+        "color": color.value,
+        "timestamp": (timestamp or datetime.now(_UTC)).isoformat(),
+        "author": author,
+        "footer": {
+            "text": f"StaffLens Analysis • Threshold: {fit_threshold} • Model: Gemini 3 Flash",
+        },
+        "fields": fields,
+    })
+
+
+def _clip(text: str, limit: int) -> str:
+    """Fit text within a field limit, marking a cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit - 1] + "…"
+
+
+def _bullet_join(items: list, limit: Optional[int] = None, prefix: str = "• ") -> str:
+    """Format up to `limit` items (all if None) as one line each, without slicing."""
+    return "\n".join(f"{prefix}{item}" for item in islice(items, limit))
+
+
+def _quote_join(quotes: list, limit: int) -> str:
+    """Format up to `limit` quotes as Markdown block quotes."""
+    return "\n".join(f'> "{quote}"' for quote in islice(quotes, limit))
 
 
-def _create_score_bar(score: int, total: int = 100, length: int = 20) -> str:
+def _score_fill_char(score: int) -> str:
+    """Color-coded bar segment for a score."""
+    if score >= 80:
+        return "🟩"
+    elif score >= 60:
+        return "🟨"
+    elif score >= 40:
+        return "🟧"
+    return "🟥"
+
+
+# Every default-size bar, indexed by [fill char][filled segments]
+_BAR_LENGTH = 20
+_BAR_CACHE = {
+    fill_char: tuple(
+        fill_char * filled + "⬜" * (_BAR_LENGTH - filled)
+        for filled in range(_BAR_LENGTH + 1)
+    )
+    for fill_char in ("🟩", "🟨", "🟧", "🟥")
+}
+
+
+def _create_score_bar(score: int, total: int = 100, length: int = _BAR_LENGTH) -> str:
     """
     Create a visual progress bar for scores.
     
@@ -199,24 +242,18 @@ def _create_score_bar(score: int, total: int = 100, length: int = 20) -> str:
         Unicode progress bar string
     """
     filled = int((score / total) * length)
-    empty = length - filled
-    
-    # Color-coded segments
-    if score >= 80:
-        fill_char = "🟩"
-    elif score >= 60:
-        fill_char = "🟨"
-    elif score >= 40:
-        fill_char = "🟧"
-    else:
-        fill_char = "🟥"
-    
-    return fill_char * filled + "⬜" * empty
+    fill_char = _score_fill_char(score)
+
+    # Default-size bars are prebuilt; anything else is assembled here
+    if length == _BAR_LENGTH and 0 <= filled <= length:
+        return _BAR_CACHE[fill_char][filled]
+    return fill_char * filled + "⬜" * (length - filled)
 
 
 def create_session_start_embed(
     applicant: discord.Member,
     channel: discord.VoiceChannel,
+    timestamp: Optional[datetime] = None,
 ) -> discord.Embed:
     """
     Create an embed for when an interview session starts.
@@ -224,6 +261,7 @@ def create_session_start_embed(
     Args:
         applicant: The applicant member
         channel: Voice channel being recorded
+        timestamp: Embed time (defaults to now)
         
     Returns:
         Discord Embed
@@ -232,13 +270,14 @@ def create_session_start_embed(
         title="🎙️ Interview Session Started",
         description=f"Recording interview with **{applicant.display_name}**",
         color=discord.Color.blue(),
-        timestamp=datetime.utcnow(),
+        timestamp=timestamp or datetime.now(_UTC),
     )
     
     embed.add_field(name="Channel", value=channel.name, inline=True)
     embed.add_field(name="Applicant ID", value=str(applicant.id), inline=True)
     
-    embed.set_thumbnail(url=applicant.avatar.url if applicant.avatar else None)
+    avatar = getattr(applicant, "avatar", None)
+    embed.set_thumbnail(url=avatar.url if avatar else None)
     embed.set_footer(text="StaffLens • Recording in progress")
     
     return embed
@@ -248,6 +287,7 @@ def create_error_embed(
     title: str,
     description: str,
     details: Optional[str] = None,
+    timestamp: Optional[datetime] = None,
 ) -> discord.Embed:
     """
     Create an error embed.
@@ -256,6 +296,7 @@ def create_error_embed(
         title: Error title
         description: Error description
         details: Optional technical details
+        timestamp: Embed time (defaults to now)
         
     Returns:
         Discord Embed
@@ -264,13 +305,13 @@ def create_error_embed(
         title=f"❌ {title}",
         description=description,
         color=discord.Color.red(),
-        timestamp=datetime.utcnow(),
+        timestamp=timestamp or datetime.now(_UTC),
     )
     
     if details:
         embed.add_field(
             name="Details",
-            value=f"```{details[:1000]}```",
+            value=f"```{_clip(details, 1000)}```",
             inline=False,
         )
     
@@ -280,6 +321,7 @@ def create_error_embed(
 def create_success_embed(
     title: str,
     description: str,
+    timestamp: Optional[datetime] = None,
 ) -> discord.Embed:
     """
     Create a success embed.
@@ -287,6 +329,7 @@ def create_success_embed(
     Args:
         title: Success title
         description: Success description
+        timestamp: Embed time (defaults to now)
         
     Returns:
         Discord Embed
@@ -295,5 +338,5 @@ def create_success_embed(
         title=f"✅ {title}",
         description=description,
         color=discord.Color.green(),
-        timestamp=datetime.utcnow(),
+        timestamp=timestamp or datetime.now(_UTC),
     )
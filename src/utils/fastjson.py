@@ -0,0 +1,32 @@
+"""
+Fast JSON - orjson when installed, the standard library otherwise.
+
+The LLM request bodies grow with every interview turn, so encoding
+them is worth doing in C.
+"""
+
+import json
+from typing import Any, Union
+
+# Try to import orjson, fall back to json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson's decode error subclasses this, so callers can catch it either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
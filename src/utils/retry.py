@@ -0,0 +1,38 @@
+"""
+Retry Utilities - Backoff delays for retrying upstream API calls.
+
+Jitter keeps concurrent interviews from retrying in lockstep
+when a provider has an incident.
+"""
+
+import random
+from typing import Optional
+
+# Longest we'll wait between attempts, even if asked to wait longer
+MAX_RETRY_DELAY = 8.0
+
+
+def backoff_delay(
+    attempt: int,
+    retry_after: Optional[str] = None,
+    max_delay: float = MAX_RETRY_DELAY,
+) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: The response's Retry-After header, if any (seconds form)
+        max_delay: Cap on the delay (background callers can afford more)
+
+    Returns:
+        The server's requested delay (capped at max_delay) when given,
+        otherwise exponential backoff from a base capped at max_delay,
+        scaled by 0.5-1.5x jitter
+    """
+    if retry_after:
+        try:
+            return min(max_delay, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form - fall back to our own backoff
+    return min(max_delay, 2 ** attempt) * (0.5 + random.random())
@@ -0,0 +1,88 @@
+"""
+Send Pool - Per-channel queues for outgoing Discord messages.
+
+Lets multi-message admin flows dispatch sends without waiting on each
+other, while each channel's messages go out in order on their own worker,
+so one slow or rate-limited channel never holds up replies elsewhere.
+"""
+
+import asyncio
+import logging
+from typing import Any, Optional
+
+import discord
+
+logger = logging.getLogger("stafflens.send_pool")
+
+
+class SendPool:
+    """
+    One send queue per channel, each drained by its own worker task.
+
+    A channel's worker is started on its first queued message and exits
+    once the queue is empty, so idle channels cost nothing.
+    """
+
+    def __init__(self):
+        self._queues: dict[int, asyncio.Queue] = {}
+        self._workers: dict[int, asyncio.Task] = {}
+
+    async def _worker(self, channel_id: int, queue: asyncio.Queue):
+        """Send a channel's queued messages in order until none are left."""
+        try:
+            while not queue.empty():
+                channel, kwargs, future = queue.get_nowait()
+                try:
+                    if not future.cancelled():
+                        message = await channel.send(**kwargs)
+                        if not future.done():
+                            future.set_result(message)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # Nothing can be queued between the empty check and here (no await)
+            del self._workers[channel_id]
+            del self._queues[channel_id]
+            while not queue.empty():
+                queue.get_nowait()[2].cancel()
+
+    async def submit(self, channel: discord.abc.Messageable, **kwargs: Any) -> discord.Message:
+        """
+        Queue a message and wait for it to be sent.
+
+        Args:
+            channel: Where to send the message
+            **kwargs: Passed through to `channel.send` (content, embed, file, ...)
+
+        Returns:
+            The sent message
+        """
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.get(channel.id)
+        if queue is None:
+            queue = self._queues[channel.id] = asyncio.Queue()
+            self._workers[channel.id] = asyncio.create_task(self._worker(channel.id, queue))
+        queue.put_nowait((channel, kwargs, future))
+        return await future
+
+    async def close(self):
+        """Stop all workers, cancelling messages that haven't been sent."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+# Singleton instance
+_send_pool: Optional[SendPool] = None
+
+def get_send_pool() -> SendPool:
+    """Get or create the send pool singleton."""
+    global _send_pool
+    if _send_pool is None:
+        _send_pool = SendPool()
+    return _send_pool